@@ -1,5 +1,6 @@
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
 import rungekutta as rk
 
 # Claire O'Connor, Amelia Abruscato & Shreyan Goswami
@@ -24,16 +25,6 @@ dt = 0.01 # time step
 # Calculate number of steps
 num_steps = int(t_max / dt)
 
-#arrays to store results
-time = np.zeros(num_steps)
-position = np.zeros(num_steps)
-velocity = np.zeros(num_steps)
-total_energy = np.zeros(num_steps)
-
-# Set initial conditions
-position[0] = x0
-velocity[0] = v0
-
 # Function to calculate acceleration
 def calculate_acceleration(x):
     return -omega**2 * x
@@ -44,45 +35,68 @@ def calculate_total_energy(x, v, m, k):
     potential_energy = 0.5 * k * x**2
     return kinetic_energy + potential_energy
 
-# Euler method simulation
-for i in range(1, num_steps):
-    time[i] = time[i-1] + dt
-
-    # Calculate acceleration at current state
-    a = calculate_acceleration(position[i-1])
+def euler_advance(t0, y, count, out):
+    """Semi-implicit Euler steps in the rk.run_blocks stepper interface"""
+    x, v = y
+    out[0] = y
+    for i in range(1, count + 1):
+        # Updated  position and velocity using Euler method
+        v = v + calculate_acceleration(x) * dt
+        x = x + v * dt # Note: Using the new v for position update
+        out[i, 0] = x
+        out[i, 1] = v
+    return out
+
+def euler(x0, v0, num_steps, output=None):
+    """
+    Euler method simulation over num_steps samples. Returns the time,
+    position, velocity and total_energy arrays, or, given an output policy
+    from rungekutta (Decimate, RunningStats, Stream), that policy's result
+    with memory independent of num_steps.
+    """
+    if output is not None:
+        return rk.run_blocks(euler_advance, [x0, v0], dt, num_steps - 1, m, k, output)
+    states = euler_advance(0.0, [x0, v0], num_steps - 1, np.empty((num_steps, 2)))
+    time = np.arange(num_steps) * dt
+    position, velocity = states[:, 0], states[:, 1]
+    return time, position, velocity, calculate_total_energy(position, velocity, m, k)
+
+def simulate(x0=x0, v0=v0):
+    """Total energy over time of the Euler and Runge Kutta solutions"""
+    # Euler method simulation
+    time, position, velocity, total_energy = euler(x0, v0, num_steps)
+
+    # Runge Kutta method
+    rk_time, pos, vel, PE, KE, rk_energy = rk.RungeKutta(x0, v0, dt, t_max, m, k)
+    return time, total_energy, rk_time, rk_energy
+
+def plot_energy(time, total_energy, rk_time, rk_energy, show_Euler=True, show_RK=True):
+    """Plotting the total energy"""
+    import matplotlib.pyplot as plt
 
-    # Updated  position and velocity using Euler method
-    velocity[i] = velocity[i-1] + a * dt
-    position[i] = position[i-1] + velocity[i] * dt # Note: Using v[i-1] for position update
-
-    # Calculate total energy
-    total_energy[i] = calculate_total_energy(position[i], velocity[i], m, k)
-
-# Plotting the total energy
-show_Euler = True
-if show_Euler:
     plt.figure(figsize=(8, 6))
-    plt.plot(time, total_energy, label='Euler')
+    if show_Euler:
+        plt.plot(time, total_energy, label='Euler')
+    if show_RK:
+        plt.plot(rk_time, rk_energy, label='Runge Kutta')
     plt.xlabel('Time (s)')
     plt.ylabel('Total Energy (J)')
-    plt.title('Total Energy of SHM System (Euler Method)')
+    plt.title('Total Energy of SHM System')
     plt.grid(True)
-    #plt.legend()
-    #plt.show()
-    
-# Runge Kutta method
-time, pos, vel, PE, KE, total_energy = rk.RungeKutta(x0, v0, dt, t_max, m, k)
-total_energy = np.array(total_energy)
-
-# Plotting the total energy
-show_RK = True
-if show_RK:
-    #plt.figure(figsize=(8, 6))
-    plt.plot(time, total_energy, label='Runge Kutta')
-    #plt.xlabel('Time (s)')
-    #plt.ylabel('Total Energy (J)')
-    #plt.title('Total Energy of SHM System (Runge Kutta Method)')
-    #plt.grid(True)
     plt.legend()
     plt.show()
 
+def main():
+    parser = argparse.ArgumentParser(description='Energy of the simple harmonic oscillator (Euler vs Runge Kutta)')
+    parser.add_argument('--x0', type=float, default=x0, help='initial position')
+    parser.add_argument('--v0', type=float, default=v0, help='initial velocity')
+    parser.add_argument('--no-plot', action='store_true', help='print the final energies only')
+    args = parser.parse_args()
+
+    time, total_energy, rk_time, rk_energy = simulate(args.x0, args.v0)
+    print(f"Final total energy: Euler {total_energy[-1]:.6f} J, Runge Kutta {rk_energy[-1]:.6f} J")
+    if not args.no_plot:
+        plot_energy(time, total_energy, rk_time, rk_energy)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# Chain of N masses coupled by nearest-neighbour springs
+# and a scaling benchmark across N
+import argparse
+import time
+
+import numpy as np
+
+import rungekutta as rk
+import symplectic
+
+BOUNDARIES = ('fixed', 'free', 'periodic')
+
+RK_BUFFER_BYTES = 2**26
+
+class SpringChain:
+    """
+    N equal masses joined by equal springs. Spring j connects masses j-1
+    and j, so the force on mass i is k*(e[i+1] - e[i]) with the spring
+    extensions e = diff(x) padded by the boundary: 'fixed' ends are tied
+    to walls at rest, 'free' ends have no outer spring and 'periodic'
+    closes the chain into a ring.
+
+    The force is two vectorized differences into a preallocated buffer, so
+    a step costs O(N) with no Python loop over masses.
+    """
+
+    def __init__(self, n, mass=1.0, k=1.0, boundary='fixed'):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"boundary must be one of {BOUNDARIES}, got {boundary!r}")
+        self.n = n
+        self.mass = mass
+        self.k = k
+        self.boundary = boundary
+        self._ext = np.zeros(n + 1)
+
+    def extensions(self, x):
+        """Spring extensions, length N + 1 (the boundary springs at both ends)"""
+        ext = self._ext
+        np.subtract(x[1:], x[:-1], out=ext[1:-1])
+        if self.boundary == 'fixed':
+            ext[0] = x[0]
+            ext[-1] = -x[-1]
+        elif self.boundary == 'periodic':
+            ext[0] = ext[-1] = x[0] - x[-1]
+        return ext
+
+    def acceleration(self, x, out=None):
+        ext = self.extensions(x)
+        out = np.subtract(ext[1:], ext[:-1], out=out)
+        out *= self.k / self.mass
+        return out
+
+    def derivatives(self, t, y, dydt):
+        """rhs for rungekutta.integrate with y = (positions, velocities) of shape (2, N)"""
+        dydt[0] = y[1]
+        self.acceleration(y[0], out=dydt[1])
+        return dydt
+
+    def energy(self, x, v):
+        ext = self.extensions(x)
+        if self.boundary == 'periodic':
+            ext = ext[1:]  # the ring spring appears at both ends
+        return 0.5 * self.mass * np.dot(v, v) + 0.5 * self.k * np.dot(ext, ext)
+
+def initial_state(n, amplitude=0.01, seed=0):
+    """Small random displacements at rest"""
+    rng = np.random.default_rng(seed)
+    return amplitude * rng.standard_normal(n), np.zeros(n)
+
+def _run_verlet(chain, x, v, step, num_steps):
+    return symplectic.velocity_verlet(x, v, chain.acceleration, step, num_steps)
+
+def _run_rk4(chain, x, v, step, num_steps):
+    # Advance in blocks through one reused trajectory buffer, as
+    # symplectic.runge_kutta4 does, capped at RK_BUFFER_BYTES for large N
+    y = np.stack([x, v])
+    block = min(num_steps, max(1, RK_BUFFER_BYTES // y.nbytes - 1))
+    out = np.empty((block + 1,) + y.shape)
+    done = 0
+    while done < num_steps:
+        count = min(block, num_steps - done)
+        rk.integrate(chain.derivatives, y, step, count, 'rk4', done * step, out[:count + 1])
+        y[...] = out[count]
+        done += count
+    return y[0], y[1]
+
+STEPPERS = {'verlet': _run_verlet, 'rk4': _run_rk4}
+
+def scaling_benchmark(sizes=(10**3, 10**4, 10**5, 10**6), methods=('verlet', 'rk4'),
+                      num_steps=100, step=0.05, boundary='fixed'):
+    """
+    Time num_steps steps for every chain size and method. Reports seconds
+    per step, nanoseconds per mass per step (flat when the cost is linear
+    in N) and the relative energy change over the run.
+    """
+    records = []
+    for n in sizes:
+        chain = SpringChain(n, boundary=boundary)
+        x0, v0 = initial_state(n)
+        energy0 = chain.energy(x0, v0)
+        for method in methods:
+            start = time.perf_counter()
+            x, v = STEPPERS[method](chain, x0.copy(), v0.copy(), step, num_steps)
+            elapsed = time.perf_counter() - start
+            records.append({
+                'n': n,
+                'method': method,
+                'steps': num_steps,
+                'time_per_step_s': elapsed / num_steps,
+                'ns_per_mass_step': 1e9 * elapsed / (num_steps * n),
+                'energy_drift': abs(chain.energy(x, v) - energy0) / energy0,
+            })
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description='Scaling of the N-mass spring chain with N')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1e3, 1e4, 1e5, 1e6])
+    parser.add_argument('--methods', nargs='+', choices=list(STEPPERS), default=list(STEPPERS))
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--dt', type=float, default=0.05)
+    parser.add_argument('--boundary', choices=BOUNDARIES, default='fixed')
+    args = parser.parse_args()
+
+    records = scaling_benchmark([int(n) for n in args.sizes], args.methods, args.steps,
+                                args.dt, args.boundary)
+    print(f"{'N':>10}{'Method':>8}{'s/step':>12}{'ns/mass/step':>14}{'Energy drift':>14}")
+    for r in records:
+        print(f"{r['n']:>10}{r['method']:>8}{r['time_per_step_s']:>12.2e}"
+              f"{r['ns_per_mass_step']:>14.2f}{r['energy_drift']:>14.2e}")
+
+if __name__ == "__main__":
+    main()
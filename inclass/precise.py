@@ -1,31 +1,68 @@
+import math
+import numbers
+import operator
+import sys
+from fractions import Fraction
+
+# Python's hash of rationals is n * d^-1 modulo this prime (see Fraction.__hash__)
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+
+def _ratio(value):
+    """(numerator, denominator) of an int, Fraction, PrecisionFloat or finite float, else None"""
+    if isinstance(value, (PrecisionFloat, int, Fraction)):
+        return value.numerator, value.denominator
+    if isinstance(value, float):
+        return value.as_integer_ratio() if math.isfinite(value) else None
+    if isinstance(value, numbers.Rational):
+        return value.numerator, value.denominator
+    return None
+
+
 class PrecisionFloat: #AMAL
+    """
+    Exact rational number. Accepts ints, floats (converted exactly with
+    as_integer_ratio, so PrecisionFloat(0.1) is the binary value of 0.1),
+    decimal strings such as "-3.25", Fractions and other PrecisionFloats.
+    Supports the arithmetic, comparison and hash protocols; mixing with
+    ints, floats and Fractions gives a PrecisionFloat, and values hash
+    like the equal int, float or Fraction.
+    """
+    __slots__ = ('numerator', 'denominator')
+
     def __init__(self, value):
         if isinstance(value, str) and '.' in value:
             # Convert decimal string to fraction
-            parts = value.split('.')
-            integer_part = int(parts[0]) if parts[0] else 0
-            decimal_part = parts[1]
-            self.numerator = integer_part * (10 ** len(decimal_part)) + int(decimal_part)
+            value = value.strip()
+            sign = -1 if value.startswith('-') else 1
+            integer_part, decimal_part = value.lstrip('+-').split('.')
+            integer_part = int(integer_part) if integer_part else 0
+            decimal_part = decimal_part or '0'
+            self.numerator = sign * (integer_part * (10 ** len(decimal_part)) + int(decimal_part))
             self.denominator = 10 ** len(decimal_part)
-        elif isinstance(value, float):
-            # Convert float to fraction by finding decimal representation
-            str_val = f"{value:.15f}".rstrip('0')
-            if '.' in str_val:
-                self.__init__(str_val)
-            else:
-                self.numerator = int(value)
-                self.denominator = 1
-        else:
+        elif isinstance(value, str):
             self.numerator = int(value)
             self.denominator = 1
+        else:
+            ratio = _ratio(value)
+            if ratio is None:
+                # e.g. Decimal; nan and infinities raise ValueError/OverflowError
+                convert = getattr(value, 'as_integer_ratio', None)
+                ratio = convert() if convert else float(value).as_integer_ratio()
+            self.numerator, self.denominator = ratio
         self._simplify()
     
-    def _gcd(self, a, b): #AMAL
-        while b: a, b = b, a % b
-        return a
-    
+    @classmethod
+    def _new(cls, numerator, denominator):
+        """Fast constructor for a pair already in lowest terms with denominator > 0"""
+        self = object.__new__(cls)
+        self.numerator = numerator
+        self.denominator = denominator
+        return self
+
     def _simplify(self): #aMAL
-        gcd = self._gcd(abs(self.numerator), abs(self.denominator))
+        gcd = math.gcd(self.numerator, self.denominator)
         self.numerator //= gcd
         self.denominator //= gcd
         if self.denominator < 0:
@@ -35,62 +72,256 @@ class PrecisionFloat: #AMAL
         if self.denominator == 1:
             return str(self.numerator)
         return f"{self.numerator / self.denominator:.15g}"
-    
-    def add(self, other): #Hani
-        if not isinstance(other, PrecisionFloat):
+
+    def __repr__(self):
+        return f"PrecisionFloat({self.numerator}/{self.denominator})"
+
+    def as_integer_ratio(self):
+        return self.numerator, self.denominator
+
+    def __float__(self):
+        return self.numerator / self.denominator
+
+    def __complex__(self):
+        return complex(float(self))
+
+    @property
+    def real(self):
+        return self
+
+    @property
+    def imag(self):
+        return 0
+
+    def conjugate(self):
+        return self
+
+    def __bool__(self):
+        return self.numerator != 0
+
+    def __hash__(self):
+        # Same value as hash() of the equal int, float or Fraction
+        try:
+            inverse = pow(self.denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            result = _HASH_INF
+        else:
+            result = hash(hash(abs(self.numerator)) * inverse)
+        result = result if self.numerator >= 0 else -result
+        return -2 if result == -1 else result
+
+    # The arithmetic works on (numerator, denominator) pairs and reduces the
+    # operands by their common factors first (as fractions.Fraction does),
+    # so the products stay small and the result is already in lowest terms
+    @staticmethod
+    def _add(na, da, nb, db):
+        g = math.gcd(da, db)
+        if g == 1:
+            return PrecisionFloat._new(na * db + da * nb, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = math.gcd(t, g)
+        if g2 == 1:
+            return PrecisionFloat._new(t, s * db)
+        return PrecisionFloat._new(t // g2, s * (db // g2))
+
+    @staticmethod
+    def _mul(na, da, nb, db):
+        g1 = math.gcd(na, db)
+        g2 = math.gcd(nb, da)
+        return PrecisionFloat._new((na // g1) * (nb // g2), (da // g2) * (db // g1))
+
+    @staticmethod
+    def _div(na, da, nb, db):
+        if nb == 0:
+            raise ZeroDivisionError("Division by zero")
+        g1 = math.gcd(na, nb)
+        g2 = math.gcd(db, da)
+        num = (na // g1) * (db // g2)
+        den = (da // g2) * (nb // g1)
+        if den < 0:
+            num, den = -num, -den
+        return PrecisionFloat._new(num, den)
+
+    @staticmethod
+    def _coerce(other):
+        """Pair for the named methods, which also take anything the constructor does"""
+        ratio = _ratio(other)
+        if ratio is None:
             other = PrecisionFloat(other)
-        num = self.numerator * other.denominator + other.numerator * self.denominator
-        den = self.denominator * other.denominator
-        result = PrecisionFloat(0)
-        result.numerator, result.denominator = num, den
-        result._simplify()
-        return result
+            ratio = other.numerator, other.denominator
+        return ratio
+
+    def add(self, other): #Hani
+        return self._add(self.numerator, self.denominator, *self._coerce(other))
     
     def subtract(self, other): #srijana
-        if not isinstance(other, PrecisionFloat):
-            other = PrecisionFloat(other)
-        num = self.numerator * other.denominator - other.numerator * self.denominator
-        den = self.denominator * other.denominator
-        result = PrecisionFloat(0)
-        result.numerator, result.denominator = num, den
-        result._simplify()
-        return result
+        nb, db = self._coerce(other)
+        return self._add(self.numerator, self.denominator, -nb, db)
     
     def multiply(self, other): #Hani
-        if not isinstance(other, PrecisionFloat):
-            other = PrecisionFloat(other)
-        result = PrecisionFloat(0)
-        result.numerator = self.numerator * other.numerator
-        result.denominator = self.denominator * other.denominator
-        result._simplify()
-        return result
+        return self._mul(self.numerator, self.denominator, *self._coerce(other))
     
     def divide(self, other): #srijana
-        if not isinstance(other, PrecisionFloat):
-            other = PrecisionFloat(other)
-        if other.numerator == 0:
-            raise ZeroDivisionError("Division by zero")
-        result = PrecisionFloat(0)
-        result.numerator = self.numerator * other.denominator
-        result.denominator = self.denominator * other.numerator
-        result._simplify()
-        return result
+        return self._div(self.numerator, self.denominator, *self._coerce(other))
+
+    def __add__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._add(self.numerator, self.denominator, *ratio)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._add(self.numerator, self.denominator, -ratio[0], ratio[1])
+
+    def __rsub__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._add(ratio[0], ratio[1], -self.numerator, self.denominator)
+
+    def __mul__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._mul(self.numerator, self.denominator, *ratio)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._div(self.numerator, self.denominator, *ratio)
+
+    def __rtruediv__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return self._div(ratio[0], ratio[1], self.numerator, self.denominator)
+
+    def __floordiv__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return (self.numerator * ratio[1]) // (ratio[0] * self.denominator)
+
+    def __rfloordiv__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        return (ratio[0] * self.denominator) // (self.numerator * ratio[1])
+
+    def __mod__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        remainder = (self.numerator * ratio[1]) % (ratio[0] * self.denominator)
+        return self._div(remainder, 1, self.denominator * ratio[1], 1)
+
+    def __rmod__(self, other):
+        ratio = _ratio(other)
+        if ratio is None:
+            return NotImplemented
+        remainder = (ratio[0] * self.denominator) % (self.numerator * ratio[1])
+        return self._div(remainder, 1, self.denominator * ratio[1], 1)
+
+    def __divmod__(self, other):
+        return self // other, self % other
+
+    def __rdivmod__(self, other):
+        return other // self, other % self
+
+    def __pow__(self, exponent):
+        ratio = _ratio(exponent)
+        if ratio is None:
+            return NotImplemented
+        if ratio[1] != 1:
+            # Fractional powers are irrational in general
+            return float(self) ** float(exponent)
+        exponent = ratio[0]
+        if exponent >= 0:
+            return PrecisionFloat._new(self.numerator ** exponent, self.denominator ** exponent)
+        return self._div(1, 1, self.numerator ** -exponent, self.denominator ** -exponent)
+
+    def __rpow__(self, base):
+        ratio = _ratio(base)
+        if ratio is None:
+            return NotImplemented
+        if self.denominator == 1:
+            return PrecisionFloat._new(*ratio) ** self.numerator
+        return float(base) ** float(self)
+
+    def __trunc__(self):
+        # Truncate towards zero like int(float)
+        quotient = abs(self.numerator) // self.denominator
+        return quotient if self.numerator >= 0 else -quotient
+
+    __int__ = __trunc__
+
+    def __floor__(self):
+        return self.numerator // self.denominator
+
+    def __ceil__(self):
+        return -(-self.numerator // self.denominator)
+
+    def __round__(self, ndigits=None):
+        # Round half to even, as round() does for int, float and Fraction
+        if ndigits is None:
+            floor, remainder = divmod(self.numerator, self.denominator)
+            if remainder * 2 < self.denominator or (remainder * 2 == self.denominator and floor % 2 == 0):
+                return floor
+            return floor + 1
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return PrecisionFloat._new(round(self * shift), 1) / shift
+        return PrecisionFloat._new(round(self / shift) * shift, 1)
+
+    def __neg__(self):
+        return PrecisionFloat._new(-self.numerator, self.denominator)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return PrecisionFloat._new(abs(self.numerator), self.denominator)
+
+    # Comparisons cross-multiply with the other value's pair directly, so no
+    # temporary PrecisionFloat is created; nan and infinities compare as floats
+    def _compare(self, other, op):
+        ratio = _ratio(other)
+        if ratio is not None:
+            return op(self.numerator * ratio[1], ratio[0] * self.denominator)
+        if isinstance(other, float):
+            return op(self.numerator / self.denominator, other)
+        return NotImplemented
 
     def __lt__(self, other): #aAMAl
-        if not isinstance(other, PrecisionFloat):
-            other = PrecisionFloat(other)
-        return self.numerator * other.denominator < other.numerator * self.denominator
+        return self._compare(other, operator.lt)
     
     def __le__(self, other): #aAMaL
-        return self.__lt__(other) or self.__eq__(other)
+        return self._compare(other, operator.le)
     
     def __eq__(self, other):
-        if not isinstance(other, PrecisionFloat):
-            other = PrecisionFloat(other)
-        return self.numerator * other.denominator == other.numerator * self.denominator
+        if isinstance(other, PrecisionFloat):
+            return self.numerator == other.numerator and self.denominator == other.denominator
+        return self._compare(other, operator.eq)
     
     def __gt__(self, other):
-        return not self.__le__(other)
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+
+# Implements the numbers.Rational interface, so Fraction(x), Fraction comparisons
+# and numbers.Rational checks accept PrecisionFloat
+numbers.Rational.register(PrecisionFloat)
 
 
 # Sorting Algorithms 
@@ -1,6 +1,13 @@
+import json
+import os
+from collections import OrderedDict
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
+
+# The shared Runge-Kutta engine, result container and rendering helpers
+# live at the top of the repository, which must be on PYTHONPATH
+import rungekutta as rk
+from simresult import SimulationResult
 
 # Car suspension parameters
 m = 1500.0    # mass (kg)
@@ -20,6 +27,18 @@ dt = 0.01     # time step (s)
 # Calculate number of steps
 num_steps = int(t_max / dt)
 
+# Columns of the solve_suspension result
+RESULT_COLUMNS = ['time',
+                  'euler.displacement', 'euler.velocity', 'euler.acceleration',
+                  'rk4.displacement', 'rk4.velocity', 'rk4.acceleration',
+                  'reference.displacement', 'reference.velocity', 'reference.acceleration',
+                  'euler_error', 'rk4_error']
+
+# Reference solution cache: in-memory LRU plus an optional on-disk store
+REFERENCE_CACHE_DIR = None    # directory for cached reference solutions (None = memory only)
+REFERENCE_CACHE_MAX_BYTES = 256 * 1024**2
+REFERENCE_MEMORY_ENTRIES = 32
+
 def calculate_jerk(y, v, a):
     """
     Calculate the jerk (third derivative) from the ODE:
@@ -37,160 +56,528 @@ def ode_system(t, state):
     jerk = calculate_jerk(y, v, a)
     return [v, a, jerk]
 
-def solve_suspension():
-    """Main function to solve car suspension ODE"""
+def system_matrix():
+    """
+    Matrix A of the linear system d/dt [y, v, a] = A @ [y, v, a]
+    """
+    return np.array([[0.0, 1.0, 0.0],
+                     [0.0, 0.0, 1.0],
+                     [-c0 / m, -c1 / m, -c2 / m]])
+
+def propagator(step=dt):
+    """Exact one-step propagator exp(A * step)"""
+    from scipy.linalg import expm
+
+    return expm(system_matrix() * step)
+
+def solve_exact(state0=None, steps=num_steps, step=dt):
+    """
+    Exact (to round-off) solution on the time grid using the matrix exponential.
+
+    exp(A*dt) is computed once. Instead of one matrix product per step the
+    trajectory is filled by doubling: once the first k states are known,
+    the next k follow from a single product with exp(A*k*dt), so only
+    about log2(steps) NumPy calls are made.
+
+    Returns (time, states) with states of shape (steps, 3) = [y, v, a].
+    """
+    if state0 is None:
+        state0 = [y0, v0, a0]
+
+    states = np.empty((steps, 3))
+    states[0] = state0
+    power = propagator(step)  # exp(A * k * dt) for the current block size k
+    k = 1
+    while k < steps:
+        count = min(k, steps - k)
+        states[k:k + count] = states[:count] @ power.T
+        power = power @ power
+        k += count
+
+    time = np.arange(steps) * step
+    return time, states
+
+ENSEMBLE_BLOCK = 256           # steps per block in solve_ensemble(summary=True)
+
+def ensemble_derivatives(state, coefficients, deriv=None):
+    """
+    Time derivative of an (N, 3) array of states [y, v, a], one row per car.
+    coefficients is the (N, 3) array -[c0, c1, c2] / m per car, so that
+    jerk = coefficients · [y, v, a].
+    """
+    if deriv is None:
+        deriv = np.empty_like(state)
+    deriv[:, :2] = state[:, 1:]
+    np.einsum('ij,ij->i', coefficients, state, out=deriv[:, 2])
+    return deriv
+
+def solve_ensemble(m=None, c2=None, c1=None, c0=None, y0=None, v0=None, a0=None,
+                   method='rk4', steps=num_steps, step=dt, summary=False):
+    """
+    Simulate many suspension configurations at once.
+
+    Each parameter may be a scalar or an array; they are broadcast together
+    and flattened (C order) to N configurations, and anything left as None
+    uses the module value. All cars are advanced together as one (N, 3)
+    state array through the shared Runge-Kutta engine ('euler', 'rk4' or
+    any rungekutta.TABLEAUS method), with no arrays allocated per step.
+
+    Returns (time, states) with states of shape (steps, N, 3), or with
+    summary=True (time, metrics) where metrics holds per-car arrays of
+    max |displacement|, final displacement, max |acceleration| and RMS
+    acceleration; the trajectories are then produced ENSEMBLE_BLOCK steps
+    at a time into one reused buffer instead of being stored.
+    """
+    if method not in rk.TABLEAUS:
+        raise ValueError(f"Unknown method: {method}")
+    module = globals()
+    params = [module[name] if value is None else value for name, value in
+              zip(['m', 'c2', 'c1', 'c0', 'y0', 'v0', 'a0'], [m, c2, c1, c0, y0, v0, a0])]
+    params = np.broadcast_arrays(*[np.atleast_1d(np.asarray(p, dtype=float)) for p in params])
+    m, c2, c1, c0, y0, v0, a0 = [p.ravel() for p in params]
+
+    state = np.stack([y0, v0, a0], axis=1)
+    coefficients = -np.stack([c0, c1, c2], axis=1) / m[:, None]
+    rhs = lambda t, state, deriv: ensemble_derivatives(state, coefficients, deriv)
+
+    time = np.arange(steps) * step
+    if not summary:
+        states = np.empty((steps,) + state.shape)
+        rk.integrate(rhs, state, step, steps - 1, method, out=states)
+        return time, states
+
+    max_disp = np.abs(state[:, 0])
+    max_acc = np.abs(state[:, 2])
+    sum_acc2 = state[:, 2]**2
+    buffer = np.empty((ENSEMBLE_BLOCK + 1,) + state.shape)
+    done = 0
+    while done < steps - 1:
+        count = min(ENSEMBLE_BLOCK, steps - 1 - done)
+        block = rk.integrate(rhs, state, step, count, method, done * step, out=buffer[:count + 1])[1:]
+        np.maximum(max_disp, np.abs(block[:, :, 0]).max(axis=0), out=max_disp)
+        np.maximum(max_acc, np.abs(block[:, :, 2]).max(axis=0), out=max_acc)
+        sum_acc2 += np.einsum('ij,ij->j', block[:, :, 2], block[:, :, 2])
+        state[...] = block[-1]
+        done += count
+
+    metrics = {
+        'max_displacement': max_disp,
+        'final_displacement': state[:, 0],
+        'max_acceleration': max_acc,
+        'rms_acceleration': np.sqrt(sum_acc2 / steps),
+    }
+    return time, metrics
+
+def open_road_profile(path, dtype=np.float64):
+    """Memory-map a road profile (.npy, or raw binary samples of `dtype`)"""
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    return np.memmap(path, dtype=dtype, mode='r')
+
+def solve_forced_stream(road_path, output_path, step=dt, state0=None,
+                        chunk_size=65536, dtype=np.float64):
+    """
+    Forced response to a measured road profile, streamed from and to disk.
+
+    The road displacement r(t) acts through the spring and damper:
+    m * d³y/dt³ + c2 * d²y/dt² + c1 * dy/dt + c0 * y = c1 * dr/dt + c0 * r
+    with r sampled every `step` seconds (dr/dt by backward difference).
+    Between samples the forcing is held constant, which makes the update
+    x[i+1] = P @ x[i] + G * u[i] exact for P = exp(A*step).
+
+    The profile is memory-mapped and processed chunk_size samples at a time;
+    [y, v, a] for every sample is written chunk by chunk to output_path as a
+    (len(road), 3) .npy file, so memory use does not grow with drive length.
+
+    Returns the number of samples processed.
+    """
+    road = open_road_profile(road_path, dtype)
+    samples = len(road)
+    out = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64, shape=(samples, 3))
+
+    from scipy.signal import lfilter, ss2tf
+
+    matrix = system_matrix()
+    P = propagator(step)
+    G = np.linalg.solve(matrix, P - np.eye(3))[:, 2]
+    # y, v and a are each the forcing passed through C (zI - P)^-1 G, so the
+    # recurrence runs chunk-wide as three third-order IIR filters
+    num, den = ss2tf(P, G[:, None], np.eye(3), np.zeros((3, 1)))
+
+    # Filter states (direct form II transposed) whose free response is
+    # P^i @ x0, carried from chunk to chunk afterwards
+    x0 = np.array([y0, v0, a0] if state0 is None else state0, dtype=np.float64)
+    free = np.stack([x0, P @ x0, P @ P @ x0], axis=1)
+    zi = free.copy()
+    zi[:, 1] += den[1] * free[:, 0]
+    zi[:, 2] += den[1] * free[:, 1] + den[2] * free[:, 0]
+
+    previous = float(road[0]) if samples else 0.0
+
+    for lo in range(0, samples, chunk_size):
+        hi = min(lo + chunk_size, samples)
+        r = np.asarray(road[lo:hi], dtype=np.float64)
+        dr = np.diff(r, prepend=previous) / step
+        forcing = (c1 * dr + c0 * r) / m
+        previous = r[-1]
+
+        for j in range(3):
+            out[lo:hi, j], zi[j] = lfilter(num[j], den, forcing, zi=zi[j])
+        out.flush()
+
+    del out
+    return samples
+
+# Dormand-Prince 5(4) tableau
+DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+DP_A = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [1/5, 0, 0, 0, 0, 0],
+    [3/40, 9/40, 0, 0, 0, 0],
+    [44/45, -56/15, 32/9, 0, 0, 0],
+    [19372/6561, -25360/2187, 64448/6561, -212/729, 0, 0],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]])
+DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# Difference between the 5th and embedded 4th order weights
+DP_E = np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200, -22/525, 1/40])
+# Dense output: y(t + theta*h) = y + h * K.T @ DP_P @ [theta, theta², theta³, theta⁴]
+DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423]])
+
+def dopri45(rhs, t_span, state0, t_eval=None, rtol=1e-8, atol=1e-11,
+            first_step=None, max_step=np.inf):
+    """
+    Adaptive Dormand-Prince 5(4) integrator with dense output.
+
+    rhs(t, state) must return a NumPy array. The step size is chosen from
+    the embedded 4th order error estimate; the solution at t_eval is
+    interpolated with the 4th order continuous extension, so output points
+    do not force extra steps.
+
+    Returns (t, y, stats) with y of shape (len(state0), len(t)) like
+    solve_ivp's sol.y, and stats counting accepted and rejected steps and
+    RHS evaluations.
+    """
+    t0, t_end = t_span
+    state = np.array(state0, dtype=float)
+    if t_eval is None:
+        t_eval = np.array([t0, t_end])
+    t_eval = np.asarray(t_eval, dtype=float)
+    if t_eval.size and (t_eval[0] < t0 or t_eval[-1] > t_end or np.any(np.diff(t_eval) < 0)):
+        raise ValueError("t_eval must be sorted and lie within t_span")
+    y_out = np.empty((state.size, t_eval.size))
+
+    stages = np.empty((7, state.size))
+    stats = {'n_accepted': 0, 'n_rejected': 0, 'n_rhs': 1}
+    stages[0] = rhs(t0, state)
+
+    if first_step is None:
+        # Simple estimate of the step size from the first derivative
+        scale = atol + rtol * np.abs(state)
+        d0 = np.sqrt(np.mean((state / scale)**2))
+        d1 = np.sqrt(np.mean((stages[0] / scale)**2))
+        first_step = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h = min(first_step, max_step, t_end - t0)
+
+    # Points at t0 need no stepping
+    done = np.searchsorted(t_eval, t0, side='right')
+    y_out[:, :done] = state[:, None]
+
+    t = t0
+    while t < t_end:
+        h = min(h, t_end - t)
+        for i in range(1, 6):
+            stages[i] = rhs(t + DP_C[i] * h, state + h * (DP_A[i, :i] @ stages[:i]))
+        new_state = state + h * (DP_A[6] @ stages[:6])
+        # FSAL: the last stage is the derivative at the new point and
+        # becomes the first stage of the next step
+        stages[6] = rhs(t + h, new_state)
+        stats['n_rhs'] += 6
+
+        error = h * (DP_E @ stages)
+        scale = atol + rtol * np.maximum(np.abs(state), np.abs(new_state))
+        error_norm = np.sqrt(np.mean((error / scale)**2))
+
+        if error_norm <= 1:
+            stats['n_accepted'] += 1
+            t_new = t + h
+
+            # Dense output for every requested time inside this step
+            stop = np.searchsorted(t_eval, t_new, side='right')
+            if stop > done:
+                theta = (t_eval[done:stop] - t) / h
+                powers = np.vstack([theta, theta**2, theta**3, theta**4])
+                y_out[:, done:stop] = state[:, None] + h * (stages.T @ DP_P @ powers)
+                done = stop
+
+            t = t_new
+            state = new_state
+            stages[0] = stages[6]
+            factor = 10 if error_norm == 0 else min(10, 0.9 * error_norm**-0.2)
+        else:
+            stats['n_rejected'] += 1
+            factor = max(0.2, 0.9 * error_norm**-0.2)
+        h = min(h * factor, max_step)
+
+    return t_eval, y_out, stats
+
+_reference_memory = OrderedDict()
+
+def reference_key(reference, initial_state, t_eval, rtol, atol):
+    """Hash of everything that determines a reference solution"""
+    import hashlib
+
+    description = {
+        'solver': reference,
+        'parameters': [repr(float(p)) for p in (m, c2, c1, c0)],
+        'initial_state': [repr(float(p)) for p in initial_state],
+        'time': [repr(float(t_max)), repr(float(dt))],
+        't_eval': hashlib.sha256(np.ascontiguousarray(t_eval, dtype=float).tobytes()).hexdigest(),
+        'tolerances': [repr(float(rtol)), repr(float(atol))],
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+def _evict_reference_files(cache_dir, max_bytes):
+    """
+    Delete the least recently used cache files until the store fits in
+    max_bytes. Files are only replaced atomically, so a reader that already
+    opened one keeps a complete copy; files another process removed or
+    holds open (on Windows) are skipped.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.npy'):
+            try:
+                info = os.stat(os.path.join(cache_dir, name))
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            continue
+        total -= size
+
+def _store_reference_file(path, solution):
+    """
+    Write a cache file atomically (temporary file + os.replace) so other
+    processes never read a partial file. The cache is best effort: any
+    OSError (read-only directory, full disk, races) is ignored.
+    """
+    import tempfile
+
+    try:
+        os.makedirs(REFERENCE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=REFERENCE_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, solution)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        _evict_reference_files(REFERENCE_CACHE_DIR, REFERENCE_CACHE_MAX_BYTES)
+    except OSError:
+        pass
+
+def reference_solution(reference, initial_state, t_eval, rtol=1e-8, atol=1e-11, use_cache=True):
+    """
+    Tight-tolerance reference solution of shape (3, len(t_eval)).
+
+    Solutions are cached by reference_key: first in memory (LRU of
+    REFERENCE_MEMORY_ENTRIES), then, if REFERENCE_CACHE_DIR is set, as .npy
+    files there, trimmed to REFERENCE_CACHE_MAX_BYTES by deleting the least
+    recently used files. Cached arrays are read-only.
+    """
+    key = reference_key(reference, initial_state, t_eval, rtol, atol) if use_cache else None
+    if key in _reference_memory:
+        _reference_memory.move_to_end(key)
+        return _reference_memory[key]
+
+    path = os.path.join(REFERENCE_CACHE_DIR, key + '.npy') if key and REFERENCE_CACHE_DIR else None
+    solution = None
+    if path:
+        try:
+            solution = np.load(path)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            solution = None  # missing, evicted or unreadable: treat as a miss
+    if solution is None:
+        t_span = (0, t_max)
+        if reference == 'dopri':
+            matrix = system_matrix()
+            _, solution, _ = dopri45(lambda t, state: matrix @ state, t_span, initial_state,
+                                     t_eval=t_eval, rtol=rtol, atol=atol)
+        else:
+            from scipy.integrate import solve_ivp
+            sol = solve_ivp(ode_system, t_span, initial_state, t_eval=t_eval, 
+                            method='RK45', rtol=rtol, atol=atol)
+            solution = sol.y
+        if path:
+            _store_reference_file(path, solution)
+
+    if key:
+        solution.setflags(write=False)
+        _reference_memory[key] = solution
+        if len(_reference_memory) > REFERENCE_MEMORY_ENTRIES:
+            _reference_memory.popitem(last=False)
+    return solution
+
+def solve_suspension(reference='scipy', use_cache=True):
+    """
+    Main function to solve car suspension ODE
+
+    reference selects the tight-tolerance solver used for the error
+    analysis: 'scipy' (solve_ivp RK45) or 'dopri' (the native dopri45).
+    The reference is reused from the cache when nothing it depends on has
+    changed (see reference_solution).
+
+    Returns a SimulationResult with the columns in RESULT_COLUMNS; it
+    unpacks in the same order as the tuple this function used to return.
+    """
     
-    # Arrays to store results
-    time = np.zeros(num_steps)
-    displacement_euler = np.zeros(num_steps)
-    velocity_euler = np.zeros(num_steps)
-    acceleration_euler = np.zeros(num_steps)
-
-    displacement_rk4 = np.zeros(num_steps)
-    velocity_rk4 = np.zeros(num_steps)
-    acceleration_rk4 = np.zeros(num_steps)
-
-    # Set initial conditions
-    time[0] = 0.0
-    displacement_euler[0] = y0
-    velocity_euler[0] = v0
-    acceleration_euler[0] = a0
-
-    displacement_rk4[0] = y0
-    velocity_rk4[0] = v0
-    acceleration_rk4[0] = a0
-
-    # Euler method simulation
-    for i in range(1, num_steps):
-        time[i] = time[i-1] + dt
-        
-        # Calculate jerk at current state
-        jerk = calculate_jerk(displacement_euler[i-1], velocity_euler[i-1], acceleration_euler[i-1])
-        
-        # Update using Euler method
-        displacement_euler[i] = displacement_euler[i-1] + velocity_euler[i-1] * dt
-        velocity_euler[i] = velocity_euler[i-1] + acceleration_euler[i-1] * dt
-        acceleration_euler[i] = acceleration_euler[i-1] + jerk * dt
-
-    # Runge-Kutta method simulation  
-    for i in range(1, num_steps):
-        y = displacement_rk4[i-1]
-        v = velocity_rk4[i-1]
-        a = acceleration_rk4[i-1]
-        
-        # k1 values
-        k1_y = v
-        k1_v = a
-        k1_a = calculate_jerk(y, v, a)
-        
-        # k2 values
-        y_k2 = y + k1_y * dt/2
-        v_k2 = v + k1_v * dt/2
-        a_k2 = a + k1_a * dt/2
-        k2_y = v_k2
-        k2_v = a_k2
-        k2_a = calculate_jerk(y_k2, v_k2, a_k2)
-        
-        # k3 values
-        y_k3 = y + k2_y * dt/2
-        v_k3 = v + k2_v * dt/2
-        a_k3 = a + k2_a * dt/2
-        k3_y = v_k3
-        k3_v = a_k3
-        k3_a = calculate_jerk(y_k3, v_k3, a_k3)
-        
-        # k4 values
-        y_k4 = y + k3_y * dt
-        v_k4 = v + k3_v * dt
-        a_k4 = a + k3_a * dt
-        k4_y = v_k4
-        k4_v = a_k4
-        k4_a = calculate_jerk(y_k4, v_k4, a_k4)
-        
-        # Final RK4 update
-        displacement_rk4[i] = y + (k1_y + 2*k2_y + 2*k3_y + k4_y) * dt/6
-        velocity_rk4[i] = v + (k1_v + 2*k2_v + 2*k3_v + k4_v) * dt/6
-        acceleration_rk4[i] = a + (k1_a + 2*k2_a + 2*k3_a + k4_a) * dt/6
-
-    # SciPy solve_ivp for comparison
     initial_state = [y0, v0, a0]
-    t_span = (0, t_max)
-    t_eval = time
+    metadata = {'m': m, 'c2': c2, 'c1': c1, 'c0': c0, 'y0': y0, 'v0': v0, 'a0': a0,
+                't_max': t_max, 'dt': dt, 'reference': reference}
+    result = SimulationResult.empty(num_steps, RESULT_COLUMNS, metadata)
+    time = result.time
+    time[:] = np.arange(num_steps) * dt
 
-    sol = solve_ivp(ode_system, t_span, initial_state, t_eval=t_eval, 
-                    method='RK45', rtol=1e-8, atol=1e-11)
+    # Euler and RK4 through the shared Butcher-tableau integrator
+    matrix = system_matrix()
+    rhs = lambda t, state, deriv: np.matmul(matrix, state, out=deriv)
 
-    displacement_scipy = sol.y[0]
-    velocity_scipy = sol.y[1]
-    acceleration_scipy = sol.y[2]
+    rk.integrate(rhs, initial_state, dt, num_steps - 1, 'euler', out=result.state('euler'))
+    rk.integrate(rhs, initial_state, dt, num_steps - 1, 'rk4', out=result.state('rk4'))
+
+    # SciPy solve_ivp (or dopri45) for comparison
+    reference_y = reference_solution(reference, initial_state, time, use_cache=use_cache)
+    result.state('reference')[:] = reference_y.T
 
     # Calculate errors
-    error_euler_disp = np.abs(displacement_euler - displacement_scipy)
-    error_rk4_disp = np.abs(displacement_rk4 - displacement_scipy)
+    np.abs(result['euler.displacement'] - result['reference.displacement'], out=result['euler_error'])
+    np.abs(result['rk4.displacement'] - result['reference.displacement'], out=result['rk4_error'])
+
+    return result
+
+# Legend labels for the reference solvers of solve_suspension
+REFERENCE_LABELS = {'scipy': 'SciPy solve_ivp', 'dopri': 'dopri45'}
 
-    return (time, 
-            displacement_euler, velocity_euler, acceleration_euler,
-            displacement_rk4, velocity_rk4, acceleration_rk4,
-            displacement_scipy, velocity_scipy, acceleration_scipy,
-            error_euler_disp, error_rk4_disp)
+def _comparison_axes(fig, reference_label):
+    """Lay out the 2x2 comparison plot; returns the line objects in series order"""
+    lines = []
+    panels = [('Displacement (m)', 'Displacement vs Time'),
+              ('Velocity (m/s)', 'Velocity vs Time'),
+              ('Acceleration (m/s²)', 'Acceleration vs Time')]
+    for i, (ylabel, title) in enumerate(panels):
+        ax = fig.add_subplot(2, 2, i + 1)
+        lines.append(ax.plot([], [], 'r--', label='Euler Method', linewidth=2)[0])
+        lines.append(ax.plot([], [], 'b-', label='4th Order RK', linewidth=2)[0])
+        lines.append(ax.plot([], [], 'g-.', label=reference_label, linewidth=2)[0])
+        ax.set_xlabel('Time (s)', fontsize=14)
+        ax.set_ylabel(ylabel, fontsize=14)
+        ax.set_title(title, fontsize=14)
+        if i == 0:
+            ax.legend(fontsize=14, labelspacing=1.5, handlelength=2.5)
+        else:
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    # Plot 4: Error comparison
+    ax = fig.add_subplot(2, 2, 4)
+    ax.set_yscale('log')
+    lines.append(ax.plot([], [], 'r-', label='Euler Error', linewidth=2)[0])
+    lines.append(ax.plot([], [], 'b-', label='RK4 Error', linewidth=2)[0])
+    ax.set_xlabel('Time (s)',fontsize=14)
+    ax.set_ylabel('Absolute Error (m)', fontsize=14)
+    ax.set_title('Error Analysis', fontsize=14)
+    ax.legend(fontsize=14)
+    ax.grid(True, alpha=0.3)
+    return lines
 
 def create_plots(time, disp_euler, vel_euler, acc_euler, 
                 disp_rk4, vel_rk4, acc_rk4,
                 disp_scipy, vel_scipy, acc_scipy,
-                error_euler, error_rk4):
-    """Create all plots"""
-    
-    # Main comparison plots
-    plt.figure(figsize=(12, 8))
-
-    # Plot 1: Displacement
-    plt.subplot(2, 2, 1)
-    plt.plot(time, disp_euler, 'r--', label='Euler Method', linewidth=2)
-    plt.plot(time, disp_rk4, 'b-', label='4th Order RK', linewidth=2)
-    plt.plot(time, disp_scipy, 'g-.', label='SciPy solve_ivp', linewidth=2)
-    plt.xlabel('Time (s)', fontsize=14)
-    plt.ylabel('Displacement (m)', fontsize=14)
-    plt.title('Displacement vs Time', fontsize= 14)
-    plt.legend(fontsize=14, labelspacing=1.5, handlelength=2.5)
-    plt.grid(True, alpha=0.3)
-
-    # Plot 2: Velocity
-    plt.subplot(2, 2, 2)
-    plt.plot(time, vel_euler, 'r--', label='Euler Method', linewidth=2)
-    plt.plot(time, vel_rk4, 'b-', label='4th Order RK', linewidth=2)
-    plt.plot(time, vel_scipy, 'g-.', label='SciPy solve_ivp', linewidth=2)
-    plt.xlabel('Time (s)', fontsize=14)
-    plt.ylabel('Velocity (m/s)', fontsize=14)
-    plt.title('Velocity vs Time', fontsize=14)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-
-    # Plot 3: Acceleration
-    plt.subplot(2, 2, 3)
-    plt.plot(time, acc_euler, 'r--', label='Euler Method', linewidth=2)
-    plt.plot(time, acc_rk4, 'b-', label='4th Order RK', linewidth=2)
-    plt.plot(time, acc_scipy, 'g-.', label='SciPy solve_ivp', linewidth=2)
-    plt.xlabel('Time (s)', fontsize=14)
-    plt.ylabel('Acceleration (m/s²)', fontsize=14)
-    plt.title('Acceleration vs Time', fontsize=14)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+                error_euler, error_rk4, save_path=None, max_points=None,
+                metadata=None):
+    """
+    Create all plots.
 
-    # Plot 4: Error comparison
-    plt.subplot(2, 2, 4)
-    plt.semilogy(time, error_euler, 'r-', label='Euler Error', linewidth=2)
-    plt.semilogy(time, error_rk4, 'b-', label='RK4 Error', linewidth=2)
-    plt.xlabel('Time (s)',fontsize=14)
-    plt.ylabel('Absolute Error (m)', fontsize=14)
-    plt.title('Error Analysis', fontsize=14)
-    plt.legend(fontsize=14)
-    plt.grid(True, alpha=0.3)
-
-    plt.suptitle('Car Suspension System Analysis\n' + 
-                 f'm={m} kg, c₂={c2} kg·s, c₁={c1} kg/s, c₀={c0} kg/s²', 
+    With save_path the figure is written to that file (PNG, SVG, ... by
+    extension) without pyplot or a display, reusing the same figure and
+    line objects on every call. max_points downsamples long trajectories.
+    metadata is the result's metadata (see solve_suspension); the title and
+    the reference legend are taken from it, falling back to the module
+    parameters and SciPy when it is not given.
+    """
+    import render
+
+    params = {'m': m, 'c2': c2, 'c1': c1, 'c0': c0, 'reference': 'scipy'}
+    params.update(metadata or {})
+    label = REFERENCE_LABELS[params['reference']]
+    fig, state = render.figure('suspension', save_path is not None, figsize=(12, 8))
+    created = not state
+    if created:
+        state['lines'] = _comparison_axes(fig, label)
+        state['reference'] = label
+    elif state['reference'] != label:
+        # The reference line is the third in each of the first three panels
+        for ax, line in zip(fig.axes, state['lines'][2:9:3]):
+            line.set_label(label)
+            ax.get_legend().get_texts()[2].set_text(label)
+        state['reference'] = label
+
+    time, *series = render.downsample(time, disp_euler, disp_rk4, disp_scipy,
+                                      vel_euler, vel_rk4, vel_scipy,
+                                      acc_euler, acc_rk4, acc_scipy,
+                                      error_euler, error_rk4, max_points=max_points)
+    for line, values in zip(state['lines'], series):
+        line.set_data(time, values)
+    for ax in fig.axes:
+        ax.relim()
+        ax.autoscale_view()
+
+    fig.suptitle('Car Suspension System Analysis\n' + 
+                 f"m={params['m']} kg, c₂={params['c2']} kg·s, c₁={params['c1']} kg/s, c₀={params['c0']} kg/s²", 
                  fontsize=14)
-    plt.tight_layout()
-    plt.show()
+    if created:
+        fig.tight_layout()  # the layout is kept when the figure is reused
+    if save_path is None:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        fig.savefig(save_path)
+
+def render_result(result_path, image_path, max_points=2000):
+    """Plot a SimulationResult saved by solve_suspension(...).save() to image_path"""
+    result = SimulationResult.load(result_path)
+    create_plots(*result, save_path=image_path, max_points=max_points, metadata=result.metadata)
+    return image_path
+
+def render_results(result_paths, output_dir, fmt='png', workers=None, max_points=2000):
+    """
+    Render a sweep of saved results to output_dir/<result name>.<fmt> in
+    parallel worker processes. Returns the image paths.
+    """
+    import render
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    for path in result_paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        jobs.append((path, os.path.join(output_dir, f'{name}.{fmt}'), max_points))
+    return render.render_sweep(render_result, jobs, workers)
 
 def print_results(time, disp_euler, vel_euler, acc_euler, 
                  disp_rk4, vel_rk4, acc_rk4,
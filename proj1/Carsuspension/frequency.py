@@ -0,0 +1,84 @@
+import numpy as np
+
+import carsus
+
+def _parameters(m, c2, c1, c0):
+    """Broadcast the coefficients (None = carsus module value) to column vectors"""
+    values = [getattr(carsus, name) if value is None else value
+              for name, value in zip(['m', 'c2', 'c1', 'c0'], [m, c2, c1, c0])]
+    values = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in values])
+    return [v.reshape(-1, 1) for v in values]
+
+def transmissibility(freqs, m=None, c2=None, c1=None, c0=None):
+    """
+    Road-to-body transfer function of the suspension,
+    H(s) = (c1*s + c0) / (m*s³ + c2*s² + c1*s + c0), at s = 2πi*f.
+
+    The coefficients may be arrays (one parameter set each); the result has
+    shape (parameter sets, len(freqs)).
+    """
+    m, c2, c1, c0 = _parameters(m, c2, c1, c0)
+    s = 2j * np.pi * np.asarray(freqs, dtype=float)
+    return (c1 * s + c0) / (((m * s + c2) * s + c1) * s + c0)
+
+def poles(m=None, c2=None, c1=None, c0=None):
+    """Roots of m*s³ + c2*s² + c1*s + c0 for every parameter set, shape (sets, 3)"""
+    m, c2, c1, c0 = [p[:, 0] for p in _parameters(m, c2, c1, c0)]
+    companion = np.zeros((m.size, 3, 3))
+    companion[:, 0, 1] = 1.0
+    companion[:, 1, 2] = 1.0
+    companion[:, 2] = np.stack([-c0 / m, -c1 / m, -c2 / m], axis=1)
+    return np.linalg.eigvals(companion)
+
+def frequency_response(freqs, m=None, c2=None, c1=None, c0=None):
+    """
+    Bode data for one or many parameter sets in one vectorized pass.
+
+    Returns a dict with magnitude, magnitude_db and phase (degrees,
+    unwrapped) of shape (sets, len(freqs)), and per set the resonance peak
+    (peak_frequency, peak_magnitude on the grid) plus the natural frequency
+    (Hz) and damping ratio of the dominant pole. A negative damping ratio
+    means the parameter set is unstable.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    response = transmissibility(freqs, m, c2, c1, c0)
+    magnitude = np.abs(response)
+    phase = np.degrees(np.unwrap(np.angle(response), axis=-1))
+
+    peak = np.argmax(magnitude, axis=-1)
+    sets = np.arange(magnitude.shape[0])
+
+    roots = poles(m, c2, c1, c0)
+    dominant = roots[sets, np.argmax(roots.real, axis=-1)]
+    natural = np.abs(dominant)
+
+    return {
+        'freqs': freqs,
+        'magnitude': magnitude,
+        'magnitude_db': 20 * np.log10(magnitude),
+        'phase': phase,
+        'peak_frequency': freqs[peak],
+        'peak_magnitude': magnitude[sets, peak],
+        'natural_frequency': natural / (2 * np.pi),
+        'damping_ratio': -dominant.real / natural,
+    }
+
+def plot_bode(response, labels=None):
+    """Magnitude and phase plot of a frequency_response result"""
+    import matplotlib.pyplot as plt
+
+    fig, (ax_mag, ax_phase) = plt.subplots(2, 1, sharex=True, figsize=(10, 8))
+    for i in range(response['magnitude'].shape[0]):
+        label = labels[i] if labels is not None else None
+        ax_mag.semilogx(response['freqs'], response['magnitude_db'][i], label=label)
+        ax_phase.semilogx(response['freqs'], response['phase'][i])
+    ax_mag.set_ylabel('Magnitude (dB)', fontsize=14)
+    ax_mag.set_title('Suspension Transmissibility', fontsize=14)
+    ax_mag.grid(True, which='both', alpha=0.3)
+    if labels is not None:
+        ax_mag.legend()
+    ax_phase.set_xlabel('Frequency (Hz)', fontsize=14)
+    ax_phase.set_ylabel('Phase (deg)', fontsize=14)
+    ax_phase.grid(True, which='both', alpha=0.3)
+    plt.tight_layout()
+    plt.show()
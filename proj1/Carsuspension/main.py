@@ -1,29 +1,23 @@
+import os
+import sys
+
+# Entry point only: put the repository root (rungekutta, simresult, render)
+# on the path; importing carsus from elsewhere needs it on PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
 from carsus import solve_suspension, create_plots, print_results
 
 def main():
     """Run car suspension ODE analysis"""
     
     # Solve the ODE using all methods
-    results = solve_suspension()
-    
-    # Unpack results
-    (time, 
-     disp_euler, vel_euler, acc_euler,
-     disp_rk4, vel_rk4, acc_rk4,
-     disp_scipy, vel_scipy, acc_scipy,
-     error_euler, error_rk4) = results
+    result = solve_suspension()
     
-    # numerical results
-    print_results(time, disp_euler, vel_euler, acc_euler, 
-                 disp_rk4, vel_rk4, acc_rk4,
-                 disp_scipy, vel_scipy, acc_scipy,
-                 error_euler, error_rk4)
+    # numerical results (the result unpacks in the order the functions expect)
+    print_results(*result)
     
     # plots
-    create_plots(time, disp_euler, vel_euler, acc_euler, 
-                disp_rk4, vel_rk4, acc_rk4,
-                disp_scipy, vel_scipy, acc_scipy,
-                error_euler, error_rk4)
+    create_plots(*result, metadata=result.metadata)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
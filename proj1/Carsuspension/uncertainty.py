@@ -0,0 +1,159 @@
+import numpy as np
+
+import carsus
+
+# Relative standard deviation of the manufacturing tolerance on each parameter
+DEFAULT_TOLERANCES = {'m': 0.05, 'c1': 0.10, 'c0': 0.10}
+
+PARAMETERS = ['m', 'c2', 'c1', 'c0', 'y0', 'v0', 'a0']
+
+def _bin_counts(disp, edges):
+    """
+    Histogram of displacement per time step, shape (steps, bins), with the
+    evenly spaced edges of each step in the matching row of edges
+    """
+    bins = edges.shape[1] - 1
+    low = edges[:, :1]
+    width = (edges[:, -1:] - low) / bins
+    index = np.clip(np.floor((disp - low) / width), 0, bins - 1).astype(np.intp)
+    flat = index + bins * np.arange(disp.shape[0])[:, None]
+    return np.bincount(flat.ravel(), minlength=disp.shape[0] * bins).reshape(disp.shape[0], bins)
+
+def _simulate_batch(seed, size, nominal, tolerances, steps, step, edges):
+    """
+    Sample one batch of parameter sets and reduce it to streaming statistics:
+    histogram counts, mean and sum of squared deviations per time step.
+    """
+    rng = np.random.default_rng(seed)
+    params = dict(nominal)
+    for name, tolerance in tolerances.items():
+        params[name] = nominal[name] * (1 + tolerance * rng.standard_normal(size))
+
+    _, states = carsus.solve_ensemble(**params, steps=steps, step=step)
+    disp = states[:, :, 0]
+    mean = disp.mean(axis=1)
+    m2 = ((disp - mean[:, None])**2).sum(axis=1)
+    counts = _bin_counts(disp, edges) if edges is not None else None
+    return size, mean, m2, disp.min(axis=1), disp.max(axis=1), counts
+
+def _percentiles_from_counts(counts, edges, percentiles):
+    """Linear interpolation of percentiles inside the histogram bins, shape (len(percentiles), steps)"""
+    cdf = np.cumsum(counts, axis=1)
+    total = cdf[:, -1:]
+    rows = np.arange(counts.shape[0])
+    result = np.empty((len(percentiles), counts.shape[0]))
+    for i, q in enumerate(percentiles):
+        target = q / 100 * total
+        index = np.argmax(cdf >= target, axis=1)
+        below = np.where(index > 0, cdf[rows, np.maximum(index - 1, 0)], 0)
+        frac = (target[:, 0] - below) / np.maximum(counts[rows, index], 1)
+        lower = edges[rows, index]
+        result[i] = lower + frac * (edges[rows, index + 1] - lower)
+    return result
+
+def monte_carlo(samples=10000, batch_size=500, tolerances=None, percentiles=(5, 50, 95),
+                seed=0, workers=None, bins=400, limits=None, steps=None, step=None):
+    """
+    Propagate parameter tolerances to the displacement over time.
+
+    Parameters in `tolerances` are drawn as nominal * (1 + tol * N(0, 1));
+    all others keep their carsus module values. Batches of batch_size cars
+    are simulated with carsus.solve_ensemble, each with its own seeded RNG
+    stream (SeedSequence.spawn), on a process pool when workers > 1. Every
+    batch is reduced to a per-time histogram and moments before it is
+    merged, so memory depends on steps x bins, not on the sample count.
+    The result is the same for any number of workers.
+
+    Each time step has its own histogram range so narrow spreads keep
+    their resolution. limits is the (low, high) displacement range, scalars
+    or arrays of length steps; by default it is the per-step range of a
+    pilot batch with a 50% margin. Values outside are counted in the end
+    bins.
+
+    Returns a dict with time, mean, std, min, max and the percentile
+    envelopes (shape (len(percentiles), steps)).
+    """
+    tolerances = DEFAULT_TOLERANCES if tolerances is None else tolerances
+    steps = carsus.num_steps if steps is None else steps
+    step = carsus.dt if step is None else step
+    nominal = {name: getattr(carsus, name) for name in PARAMETERS}
+
+    root = np.random.SeedSequence(seed)
+    pilot_seed, batch_root = root.spawn(2)
+    if limits is None:
+        _, _, _, low, high, _ = _simulate_batch(pilot_seed, batch_size, nominal, tolerances,
+                                                steps, step, None)
+        # Steps where every car agrees (t = 0) still need a non-empty range
+        margin = np.maximum(0.5 * (high - low), 1e-9 * np.maximum(np.abs(high), 1.0))
+        limits = (low - margin, high + margin)
+    low, high = [np.broadcast_to(np.asarray(limit, dtype=float), steps) for limit in limits]
+    edges = np.linspace(low, high, bins + 1, axis=1)
+
+    sizes = [min(batch_size, samples - start) for start in range(0, samples, batch_size)]
+    seeds = batch_root.spawn(len(sizes))
+    jobs = [(s, size, nominal, tolerances, steps, step, edges) for s, size in zip(seeds, sizes)]
+
+    count = 0
+    mean = np.zeros(steps)
+    m2 = np.zeros(steps)
+    low = np.full(steps, np.inf)
+    high = np.full(steps, -np.inf)
+    counts = np.zeros((steps, bins), dtype=np.int64)
+
+    def merge(result):
+        nonlocal count, mean, m2
+        n, batch_mean, batch_m2, batch_low, batch_high, batch_counts = result
+        # Chan et al. parallel update of mean and sum of squared deviations
+        total = count + n
+        delta = batch_mean - mean
+        mean = mean + delta * n / total
+        m2 = m2 + batch_m2 + delta**2 * count * n / total
+        count = total
+        np.minimum(low, batch_low, out=low)
+        np.maximum(high, batch_high, out=high)
+        np.add(counts, batch_counts, out=counts)
+
+    if workers and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep only a few batches in flight so results never pile up
+            pending = []
+            for job in jobs:
+                pending.append(pool.submit(_simulate_batch, *job))
+                if len(pending) >= 2 * workers:
+                    merge(pending.pop(0).result())
+            for future in pending:
+                merge(future.result())
+    else:
+        for job in jobs:
+            merge(_simulate_batch(*job))
+
+    return {
+        'time': np.arange(steps) * step,
+        'mean': mean,
+        'std': np.sqrt(m2 / max(count - 1, 1)),
+        'min': low,
+        'max': high,
+        'percentiles': np.asarray(percentiles),
+        'envelopes': _percentiles_from_counts(counts, edges, percentiles),
+    }
+
+def plot_envelopes(result):
+    """Mean displacement with the percentile envelopes"""
+    import matplotlib.pyplot as plt
+
+    time = result['time']
+    envelopes = result['envelopes']
+    plt.figure(figsize=(10, 6))
+    for i in range(len(envelopes) // 2):
+        plt.fill_between(time, envelopes[i], envelopes[-1 - i], alpha=0.2,
+                         label=f"{result['percentiles'][i]}-{result['percentiles'][-1 - i]} percentile")
+    plt.plot(time, result['mean'], 'b-', linewidth=2, label='Mean')
+    plt.xlabel('Time (s)', fontsize=14)
+    plt.ylabel('Displacement (m)', fontsize=14)
+    plt.title('Displacement Uncertainty from Parameter Tolerances', fontsize=14)
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,161 @@
+import argparse
+import csv
+import json
+import time
+
+import numpy as np
+
+from sininteg import (sin_squared, a, b, analytical_result, gauss_order,
+                      riemann_sum, trapezoidal_rule, simpsons_rule, gauss_legendre,
+                      adaptive_simpson, adaptive_gauss_kronrod, RombergIntegrator,
+                      InstrumentedIntegrand, _numpy_trapz)
+
+FIELDS = ['method', 'n', 'result', 'abs_error', 'wall_time_s', 'evaluations', 'calls',
+          'integrand_time_s', 'error_per_us']
+
+def _numpy_baseline(func, a, b, n):
+    x_vals = np.linspace(a, b, n + 1)
+    return _numpy_trapz(func(x_vals), x_vals)
+
+def _tolerance(n):
+    # Adaptive methods choose their own points, so n sets the tolerance instead
+    return 1.0 / n**2
+
+def _scipy_baseline(func, a, b, n):
+    from scipy import integrate
+
+    result, _ = integrate.quad(func, a, b, epsabs=_tolerance(n), epsrel=0)
+    return result
+
+def _romberg(func, a, b, n):
+    levels = max(1, int(np.log2(max(n, 1)))) + 1
+    return RombergIntegrator(func, a, b).integrate(tol=0.0, max_levels=levels)[0]
+
+# Every method takes (func, a, b, n); for the grid methods n is roughly the
+# number of evaluations, for the adaptive ones it sets the tolerance 1/n²
+METHODS = {
+    'Riemann': riemann_sum,
+    'Trapezoidal': trapezoidal_rule,
+    "Simpson's": simpsons_rule,
+    'Gauss-Legendre': lambda func, a, b, n: gauss_legendre(func, a, b, gauss_order,
+                                                           max(1, n // gauss_order)),
+    'Romberg': _romberg,
+    'Adaptive Simpson': lambda func, a, b, n: adaptive_simpson(func, a, b, _tolerance(n))[0],
+    'Gauss-Kronrod': lambda func, a, b, n: adaptive_gauss_kronrod(func, a, b, _tolerance(n))[0],
+    'NumPy trapz': _numpy_baseline,
+    'SciPy quad': _scipy_baseline,
+}
+
+def run_benchmark(func=sin_squared, a=a, b=b, exact=analytical_result,
+                  n_values=None, methods=None, repeats=3):
+    """
+    Sweep n across decades for every method.
+
+    Each (method, n) pair is timed `repeats` times and the fastest run is
+    kept. Returns a list of records with the keys in FIELDS;
+    error_per_us is the absolute error divided by the wall time in
+    microseconds.
+    """
+    if n_values is None:
+        n_values = [10**k for k in range(1, 7)]
+    methods = methods or list(METHODS)
+
+    records = []
+    for name in methods:
+        method = METHODS[name]
+        for n in n_values:
+            best = np.inf
+            for _ in range(repeats):
+                integrand = InstrumentedIntegrand(func)
+                start = time.perf_counter()
+                result = method(integrand, a, b, n)
+                best = min(best, time.perf_counter() - start)
+
+            abs_error = abs(float(result) - exact)
+            records.append({
+                'method': name,
+                'n': n,
+                'result': float(result),
+                'abs_error': abs_error,
+                'wall_time_s': best,
+                'evaluations': integrand.points,
+                'calls': integrand.calls,
+                'integrand_time_s': integrand.time,
+                'error_per_us': abs_error / (best * 1e6),
+            })
+    return records
+
+def cheapest_method(records, target_error):
+    """Fastest record whose error is at or below target_error (None if no method reaches it)"""
+    candidates = [r for r in records if r['abs_error'] <= target_error]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda r: r['wall_time_s'])
+
+def find_regressions(baseline, records, slowdown=1.5):
+    """Records that are more than `slowdown` times slower than the same (method, n) in baseline"""
+    reference = {(r['method'], r['n']): r['wall_time_s'] for r in baseline}
+    regressions = []
+    for r in records:
+        old = reference.get((r['method'], r['n']))
+        if old is not None and r['wall_time_s'] > slowdown * old:
+            regressions.append(dict(r, baseline_time_s=old))
+    return regressions
+
+def save_json(records, path):
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=2)
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+def save_csv(records, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows({key: r[key] for key in FIELDS} for r in records)
+
+def print_table(records):
+    print(f"{'Method':<18}{'n':>10}{'Error':>12}{'Time (s)':>12}{'Evals':>10}{'Calls':>8}"
+          f"{'f time (s)':>12}{'Err/us':>12}")
+    for r in records:
+        print(f"{r['method']:<18}{r['n']:>10}{r['abs_error']:>12.2e}{r['wall_time_s']:>12.2e}"
+              f"{r['evaluations']:>10}{r['calls']:>8}{r['integrand_time_s']:>12.2e}"
+              f"{r['error_per_us']:>12.2e}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the integration methods on sin²(x)')
+    parser.add_argument('--max-decade', type=int, default=6, help='largest n is 10**max_decade')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', help='write results to this JSON file')
+    parser.add_argument('--csv', help='write results to this CSV file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to check for regressions')
+    parser.add_argument('--target', type=float, help='report the cheapest method reaching this error')
+    args = parser.parse_args()
+
+    records = run_benchmark(n_values=[10**k for k in range(1, args.max_decade + 1)],
+                            repeats=args.repeats)
+    print_table(records)
+
+    if args.json:
+        save_json(records, args.json)
+    if args.csv:
+        save_csv(records, args.csv)
+    if args.target is not None:
+        best = cheapest_method(records, args.target)
+        if best is None:
+            print(f"\nNo method reached error {args.target:.1e}")
+        else:
+            print(f"\nCheapest method for error {args.target:.1e}: {best['method']} "
+                  f"(n={best['n']}, {best['wall_time_s']:.2e} s)")
+    if args.baseline:
+        regressions = find_regressions(load_json(args.baseline), records)
+        for r in regressions:
+            print(f"Regression: {r['method']} n={r['n']} "
+                  f"{r['baseline_time_s']:.2e} s -> {r['wall_time_s']:.2e} s")
+        if regressions:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
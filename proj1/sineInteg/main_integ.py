@@ -8,12 +8,14 @@ def main():
     results = solve_integration()
     
     # Unpack results
-    (riemann_result, trapezoidal_result, simpson_result, numpy_trapz, scipy_quad,
-     riemann_error, trapezoidal_error, simpson_error, numpy_error, quad_error) = results
+    (riemann_result, trapezoidal_result, simpson_result, gauss_result, numpy_trapz, scipy_quad,
+     riemann_error, trapezoidal_error, simpson_error, gauss_error, numpy_error, quad_error,
+     evaluations) = results
     
     # Print numerical results first
-    print_results(riemann_result, trapezoidal_result, simpson_result, numpy_trapz, scipy_quad,
-                 riemann_error, trapezoidal_error, simpson_error, numpy_error, quad_error)
+    print_results(riemann_result, trapezoidal_result, simpson_result, gauss_result, numpy_trapz, scipy_quad,
+                 riemann_error, trapezoidal_error, simpson_error, gauss_error, numpy_error, quad_error,
+                 evaluations)
     
     # Then create plots
     create_plots(riemann_result, trapezoidal_result, simpson_result)
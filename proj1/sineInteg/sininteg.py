@@ -1,37 +1,155 @@
+import math
+import os
+import time
+from collections import OrderedDict
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import integrate
 
 # Integration parameters
 a = 0.0                          # lower bound
 b = np.pi                        # upper bound
 n = 1000                         # number of intervals
 analytical_result = np.pi / 2    # exact value of integrating [0,π] sin²(x) dx
+gauss_order = 20                 # Gauss-Legendre nodes per panel
+GL_CACHE_DIR = None              # directory for cached Gauss-Legendre tables (None = memory only)
+
+# numpy >= 2.0 renamed trapz to trapezoid
+_numpy_trapz = getattr(np, 'trapezoid', None) or getattr(np, 'trapz')
 
 def sin_squared(x):
     """Function to integrate: sin²(x)"""
     return np.sin(x)**2
 
-def riemann_sum(func, a, b, n):
+class InstrumentedIntegrand:
+    """
+    Wraps an integrand to count calls and evaluated points and to time them.
+
+    With memo_size > 0, scalar calls (as made by integrate.quad's fallbacks
+    or hand-written loops) are memoized in an LRU cache of that size; memo
+    hits are counted separately and do not count as evaluated points.
+    Counts made inside worker processes (workers=) are not sent back.
+    """
+
+    def __init__(self, func, memo_size=0):
+        self.func = func
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.points = 0
+        self.memo_hits = 0
+        self.time = 0.0
+
+    def __call__(self, x):
+        self.calls += 1
+        scalar = self.memo_size and np.ndim(x) == 0
+        if scalar:
+            key = float(x)
+            if key in self.memo:
+                self.memo.move_to_end(key)
+                self.memo_hits += 1
+                return self.memo[key]
+
+        start = time.perf_counter()
+        y = self.func(x)
+        self.time += time.perf_counter() - start
+        self.points += np.size(x)
+
+        if scalar:
+            self.memo[key] = y
+            if len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+        return y
+
+    def summary(self):
+        return {'calls': self.calls, 'points': self.points,
+                'memo_hits': self.memo_hits, 'time': self.time}
+
+DEFAULT_CHUNK = 1 << 20          # points per chunk in chunked/parallel mode
+
+def _chunk_sums(func, start, h, first, last, chunk_size):
+    """Sums of func(start + i*h) over chunks of i in [first, last)"""
+    sums = []
+    for lo in range(first, last, chunk_size):
+        hi = min(lo + chunk_size, last)
+        x_points = start + h * np.arange(lo, hi, dtype=float)
+        sums.append(float(np.sum(func(x_points))))
+    return sums
+
+def _grid_sums(func, grids, chunk_size=None, workers=None):
+    """
+    Sum func(start + i*h) for i in [first, last) for every (start, h,
+    first, last) in grids, in fixed-size chunks. Returns one sum per grid.
+
+    Each chunk is summed pairwise by NumPy and the chunk sums are combined
+    with math.fsum (compensated, exactly rounded), so memory stays at one
+    chunk. With workers > 1 the chunks of all grids are spread over one
+    process pool; the chunk boundaries do not depend on the number of
+    workers and fsum does not depend on the order, so the result is
+    reproducible. func must be picklable (a module-level function) for
+    workers > 1.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK
+    num_chunks = sum(max(0, -(-(last - first) // chunk_size)) for _, _, first, last in grids)
+    if not workers or workers <= 1 or num_chunks == 0:
+        return [math.fsum(_chunk_sums(func, *grid, chunk_size)) for grid in grids]
+
+    # Split every grid on chunk boundaries into pieces of about
+    # 1 / workers of the total work
+    piece = -(-num_chunks // workers) * chunk_size
+    jobs = [(index, start, h, lo, min(lo + piece, last))
+            for index, (start, h, first, last) in enumerate(grids)
+            for lo in range(first, last, piece)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    sums = [[] for _ in grids]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(index, pool.submit(_chunk_sums, func, start, h, lo, hi, chunk_size))
+                   for index, start, h, lo, hi in jobs]
+        for index, future in futures:
+            sums[index].extend(future.result())
+    return [math.fsum(values) for values in sums]
+
+def _grid_sum(func, start, h, first, last, chunk_size=None, workers=None):
+    """Sum func(start + i*h) for i in [first, last); see _grid_sums"""
+    return _grid_sums(func, [(start, h, first, last)], chunk_size, workers)[0]
+
+def riemann_sum(func, a, b, n, chunk_size=None, workers=None):
     """Riemann sum using midpoint rule"""
     h = (b - a) / n
+    if chunk_size or workers:
+        return h * _grid_sum(func, a + h/2, h, 0, n, chunk_size, workers)
     x_points = np.linspace(a + h/2, b - h/2, n)
     y_values = func(x_points)
     return h * np.sum(y_values)
 
-def trapezoidal_rule(func, a, b, n):
+def trapezoidal_rule(func, a, b, n, chunk_size=None, workers=None):
     """Trapezoidal rule integration"""
     h = (b - a) / n
+    if chunk_size or workers:
+        ends = func(np.array([a, b], dtype=float))
+        interior = _grid_sum(func, a, h, 1, n, chunk_size, workers)
+        return h * (0.5 * ends[0] + interior + 0.5 * ends[1])
     x_points = np.linspace(a, b, n + 1)
     y_values = func(x_points)
     return h * (0.5 * y_values[0] + np.sum(y_values[1:-1]) + 0.5 * y_values[-1])
 
-def simpsons_rule(func, a, b, n):
+def simpsons_rule(func, a, b, n, chunk_size=None, workers=None):
     """Simpson's 1/3 rule integration"""
     if n % 2 != 0:
         n += 1  # Make even for Simpson's rule
     
     h = (b - a) / n
+    if chunk_size or workers:
+        # Odd and even interior points are separate grids with spacing 2h
+        ends = func(np.array([a, b], dtype=float))
+        odd_sum, even_sum = _grid_sums(func, [(a + h, 2 * h, 0, n // 2), (a, 2 * h, 1, n // 2)],
+                                       chunk_size, workers)
+        return (h / 3) * (ends[0] + 4 * odd_sum + 2 * even_sum + ends[1])
+
     x_points = np.linspace(a, b, n + 1)
     y_values = func(x_points)
     
@@ -40,66 +158,350 @@ def simpsons_rule(func, a, b, n):
     
     return (h / 3) * (y_values[0] + 4 * odd_sum + 2 * even_sum + y_values[-1])
 
+def _batch_rule(y_values, h, method):
+    """Apply a composite rule along the last axis of a 2D grid of samples"""
+    if method == 'riemann':
+        return h * np.sum(y_values, axis=-1)
+    if method == 'trapezoidal':
+        return h * (0.5 * y_values[:, 0] + np.sum(y_values[:, 1:-1], axis=-1) + 0.5 * y_values[:, -1])
+    odd_sum = np.sum(y_values[:, 1:-1:2], axis=-1)
+    even_sum = np.sum(y_values[:, 2:-1:2], axis=-1)
+    return (h / 3) * (y_values[:, 0] + 4 * odd_sum + 2 * even_sum + y_values[:, -1])
+
+def integrate_batch(func, a, b, n, method='simpson', params=()):
+    """
+    Integrate many integrals at once on one broadcast 2D grid.
+
+    a, b and every entry of params may be scalars or arrays; they are
+    broadcast against each other and each element defines one integral
+    func(x, *params) over [a, b]. func is called once with x of shape
+    (N, n + 1) (or (N, n) for the midpoint rule) and params of shape (N, 1).
+
+    The error estimate compares the result with the same rule on the
+    coarser grid made of every second (midpoint: every third) sample, so
+    it costs no extra function evaluations.
+
+    Returns (results, errors), both with the broadcast shape of the inputs.
+    """
+    if method not in ('riemann', 'trapezoidal', 'simpson'):
+        raise ValueError(f"Unknown method: {method}")
+
+    # Round n up so the coarse grid lines up with the fine one
+    step = 3 if method == 'riemann' else 2
+    order = 2 if method in ('riemann', 'trapezoidal') else 4
+    multiple = step * (2 if method == 'simpson' else 1)
+    n = max(multiple, -(-n // multiple) * multiple)
+
+    shape = np.broadcast_shapes(np.shape(a), np.shape(b), *[np.shape(p) for p in params])
+    a = np.broadcast_to(np.asarray(a, dtype=float), shape).reshape(-1, 1)
+    b = np.broadcast_to(np.asarray(b, dtype=float), shape).reshape(-1, 1)
+    params = [np.broadcast_to(np.asarray(p), shape).reshape(-1, 1) for p in params]
+
+    h = ((b - a) / n)[:, 0]
+    if method == 'riemann':
+        t = (np.arange(n) + 0.5) / n
+    else:
+        t = np.linspace(0.0, 1.0, n + 1)
+    x_points = a + (b - a) * t
+    y_values = func(x_points, *params)
+
+    results = _batch_rule(y_values, h, method)
+    if method == 'riemann':
+        coarse = _batch_rule(y_values[:, 1::3], 3 * h, method)
+    else:
+        coarse = _batch_rule(y_values[:, ::2], 2 * h, method)
+    errors = np.abs(results - coarse) / (step**order - 1)
+
+    return results.reshape(shape), errors.reshape(shape)
+
+def adaptive_simpson(func, a, b, tol=1e-10, max_evals=10000):
+    """
+    Adaptive Simpson's rule.
+
+    Each interval is split in half until the two halves agree with the
+    whole to within its share of tol. Function values at interval ends and
+    midpoints are cached and handed down to the sub-intervals, so every
+    refinement costs only two new evaluations.
+
+    Returns (result, error_estimate, evaluations).
+    """
+    fa, fm, fb = func(np.array([a, (a + b) / 2, b]))
+    evals = 3
+    whole = (b - a) / 6 * (fa + 4 * fm + fb)
+
+    result = 0.0
+    error = 0.0
+    stack = [(a, b, fa, fm, fb, whole, tol)]
+    while stack:
+        lo, hi, flo, fmid, fhi, whole, tol_i = stack.pop()
+        mid = (lo + hi) / 2
+        f_left, f_right = func(np.array([(lo + mid) / 2, (mid + hi) / 2]))
+        evals += 2
+
+        left = (mid - lo) / 6 * (flo + 4 * f_left + fmid)
+        right = (hi - mid) / 6 * (fmid + 4 * f_right + fhi)
+        delta = left + right - whole
+
+        # Accept when converged or when the budget does not allow splitting
+        if abs(delta) <= 15 * tol_i or evals + 2 * (len(stack) + 2) > max_evals or mid in (lo, hi):
+            result += left + right + delta / 15
+            error += abs(delta) / 15
+        else:
+            stack.append((lo, mid, flo, f_left, fmid, left, tol_i / 2))
+            stack.append((mid, hi, fmid, f_right, fhi, right, tol_i / 2))
+
+    return result, error, evals
+
+# 7-point Gauss / 15-point Kronrod nodes and weights on [-1, 1]
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+_GAUSS7_WEIGHTS = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+
+GK15_NODES = np.concatenate([-_KRONROD_NODES[:-1], _KRONROD_NODES[::-1]])
+GK15_WEIGHTS = np.concatenate([_KRONROD_WEIGHTS[:-1], _KRONROD_WEIGHTS[::-1]])
+G7_WEIGHTS = np.zeros(15)
+G7_WEIGHTS[1:8:2] = _GAUSS7_WEIGHTS
+G7_WEIGHTS[9:15:2] = _GAUSS7_WEIGHTS[-2::-1]
+
+def _gauss_kronrod_15(func, lo, hi):
+    """Kronrod estimate and |Kronrod - Gauss| error on one or more intervals"""
+    lo = np.atleast_1d(lo)
+    hi = np.atleast_1d(hi)
+    center = (lo + hi)[:, None] / 2
+    half = (hi - lo)[:, None] / 2
+    y_values = func(center + half * GK15_NODES)
+    kronrod = half[:, 0] * (y_values @ GK15_WEIGHTS)
+    gauss = half[:, 0] * (y_values @ G7_WEIGHTS)
+    return kronrod, np.abs(kronrod - gauss)
+
+def adaptive_gauss_kronrod(func, a, b, tol=1e-10, max_evals=10000):
+    """
+    Globally adaptive 7/15-point Gauss-Kronrod quadrature.
+
+    The interval with the largest error estimate is bisected until the
+    total error drops below tol or the evaluation budget is used up. Both
+    halves of a split are evaluated in a single vectorized call.
+
+    Returns (result, error_estimate, evaluations).
+    """
+    values, errors = _gauss_kronrod_15(func, a, b)
+    evals = 15
+    intervals = [(a, b)]
+
+    while errors.sum() > tol and evals + 30 <= max_evals:
+        worst = int(np.argmax(errors))
+        lo, hi = intervals[worst]
+        mid = (lo + hi) / 2
+        if mid in (lo, hi):
+            break
+        new_values, new_errors = _gauss_kronrod_15(func, [lo, mid], [mid, hi])
+        evals += 30
+
+        intervals[worst] = (lo, mid)
+        intervals.append((mid, hi))
+        values[worst] = new_values[0]
+        errors[worst] = new_errors[0]
+        values = np.append(values, new_values[1])
+        errors = np.append(errors, new_errors[1])
+
+    return values.sum(), errors.sum(), evals
+
+class RombergIntegrator:
+    """
+    Incremental Romberg integration built on the trapezoidal rule.
+
+    Going from n to 2n intervals only evaluates the n new midpoints; the
+    previous trapezoidal sum is reused. Each new level is Richardson
+    extrapolated against the earlier ones.
+    """
+
+    def __init__(self, func, a, b):
+        self.func = func
+        self.a = a
+        self.b = b
+        self.n = 1
+        self.evaluations = 2
+        self.trapezoid = trapezoidal_rule(func, a, b, 1)
+        self.table = [[self.trapezoid]]
+
+    def refine(self):
+        """Halve the step size and add one row to the Romberg table"""
+        h = (self.b - self.a) / self.n
+        midpoints = self.a + h * (np.arange(self.n) + 0.5)
+        self.trapezoid = 0.5 * self.trapezoid + 0.5 * h * np.sum(self.func(midpoints))
+        self.evaluations += self.n
+        self.n *= 2
+
+        row = [self.trapezoid]
+        for j, previous in enumerate(self.table[-1], start=1):
+            factor = 4**j
+            row.append((factor * row[-1] - previous) / (factor - 1))
+        self.table.append(row)
+        return row[-1]
+
+    @property
+    def result(self):
+        """Best (most extrapolated) estimate so far"""
+        return self.table[-1][-1]
+
+    @property
+    def error(self):
+        """Difference between the last two diagonal estimates"""
+        if len(self.table) < 2:
+            return np.inf
+        return abs(self.table[-1][-1] - self.table[-2][-1])
+
+    def integrate(self, tol=1e-10, max_levels=25):
+        """Refine until the error estimate is below tol, returns (result, error, evaluations)"""
+        while len(self.table) < max_levels and (len(self.table) < 3 or self.error > tol):
+            self.refine()
+        return self.result, self.error, self.evaluations
+
+_GL_CACHE = {}
+
+def _store_gl_table(cache_dir, path, nodes, weights):
+    """
+    Write a cache file atomically (temporary file + os.replace) so other
+    processes never read a partial file. The cache is best effort: any
+    OSError (read-only directory, full disk, races) is ignored.
+    """
+    import tempfile
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, nodes=nodes, weights=weights)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass
+
+def gauss_legendre_nodes(order, cache_dir=None):
+    """
+    Gauss-Legendre nodes and weights on [-1, 1].
+
+    Tables are computed once per order and kept in memory; if cache_dir (or
+    GL_CACHE_DIR) is set they are also stored there as .npz files so new
+    processes can load them instead of recomputing. An unreadable or
+    partial file counts as a miss.
+    """
+    if order in _GL_CACHE:
+        return _GL_CACHE[order]
+
+    cache_dir = cache_dir or GL_CACHE_DIR
+    path = os.path.join(cache_dir, f'gauss_legendre_{order}.npz') if cache_dir else None
+    table = None
+    if path:
+        import zipfile
+
+        try:
+            with np.load(path) as npz:
+                table = npz['nodes'], npz['weights']
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            table = None  # missing or unreadable: treat as a miss
+    if table is None:
+        table = np.polynomial.legendre.leggauss(order)
+        if path:
+            _store_gl_table(cache_dir, path, *table)
+
+    _GL_CACHE[order] = table
+    return table
+
+def gauss_legendre(func, a, b, order=gauss_order, panels=1):
+    """Composite Gauss-Legendre quadrature with `panels` equal sub-intervals"""
+    nodes, weights = gauss_legendre_nodes(order)
+    h = (b - a) / panels
+    centers = a + h * (np.arange(panels) + 0.5)
+    x_points = centers[:, None] + (h / 2) * nodes
+    y_values = func(x_points.ravel()).reshape(panels, order)
+    return (h / 2) * np.sum(y_values @ weights)
+
+def quad_evaluations(func, a, b, tol=1e-10):
+    """SciPy quad with the same (result, error_estimate, evaluations) output"""
+    from scipy import integrate
+
+    result, error, info = integrate.quad(func, a, b, epsabs=tol, epsrel=0, full_output=1)
+    return result, error, info['neval']
+
 def solve_integration():
     """Calculate integrals using all methods"""
+    from scipy import integrate
+    
+    # One instrumented integrand per method to count its evaluations
+    integrands = {name: InstrumentedIntegrand(sin_squared) for name in
+                  ["Riemann", "Trapezoidal", "Simpson's", "Gauss-Legendre", "NumPy trapz", "SciPy quad"]}
     
     # Custom methods
-    riemann_result = riemann_sum(sin_squared, a, b, n)
-    trapezoidal_result = trapezoidal_rule(sin_squared, a, b, n)
-    simpson_result = simpsons_rule(sin_squared, a, b, n)
+    riemann_result = riemann_sum(integrands["Riemann"], a, b, n)
+    trapezoidal_result = trapezoidal_rule(integrands["Trapezoidal"], a, b, n)
+    simpson_result = simpsons_rule(integrands["Simpson's"], a, b, n)
+    gauss_result = gauss_legendre(integrands["Gauss-Legendre"], a, b, gauss_order)
     
     # SciPy/NumPy methods
     x_vals = np.linspace(a, b, n + 1)
-    y_vals = sin_squared(x_vals)
+    y_vals = integrands["NumPy trapz"](x_vals)
     
-    numpy_trapz = np.trapz(y_vals, x_vals)
-    scipy_quad, _ = integrate.quad(sin_squared, a, b)
+    numpy_trapz = _numpy_trapz(y_vals, x_vals)
+    scipy_quad, _ = integrate.quad(integrands["SciPy quad"], a, b)
     
     # Calculate errors
     riemann_error = abs(riemann_result - analytical_result)
     trapezoidal_error = abs(trapezoidal_result - analytical_result)
     simpson_error = abs(simpson_result - analytical_result)
+    gauss_error = abs(gauss_result - analytical_result)
     numpy_error = abs(numpy_trapz - analytical_result)
     quad_error = abs(scipy_quad - analytical_result)
     
-    return (riemann_result, trapezoidal_result, simpson_result, numpy_trapz, scipy_quad,
-            riemann_error, trapezoidal_error, simpson_error, numpy_error, quad_error)
-
-def create_plots(riemann_result, trapezoidal_result, simpson_result):
-    """Create visualization plots"""
-    
-    plt.figure(figsize=(15, 6))
+    evaluations = {name: f.summary() for name, f in integrands.items()}
     
+    return (riemann_result, trapezoidal_result, simpson_result, gauss_result, numpy_trapz, scipy_quad,
+            riemann_error, trapezoidal_error, simpson_error, gauss_error, numpy_error, quad_error,
+            evaluations)
+
+def _plot_function(ax):
     # Plot 1: Function
-    #plt.subplot(1, 3, 1)
     x_plot = np.linspace(a, b, 1000)
     y_plot = sin_squared(x_plot)
-    plt.plot(x_plot, y_plot, 'b-', linewidth=2)
-    plt.fill_between(x_plot, 0, y_plot, alpha=0.3)
-    plt.xlabel('x')
-    plt.ylabel('sin²(x)')
-    plt.title('Function: sin²(x)')
-    plt.grid(True)
-    plt.show()
+    ax.plot(x_plot, y_plot, 'b-', linewidth=2)
+    ax.fill_between(x_plot, 0, y_plot, alpha=0.3)
+    ax.set_xlabel('x')
+    ax.set_ylabel('sin²(x)')
+    ax.set_title('Function: sin²(x)')
+    ax.grid(True)
+
+def _plot_errors(ax, results, n_intervals):
     # Plot 2: Method comparison
-    #plt.subplot(1, 3, 2)
     methods = ['Riemann', 'Trapezoidal', "Simpson's"]
-    results = [riemann_result, trapezoidal_result, simpson_result]
     errors = [abs(r - analytical_result) for r in results]
     
-    bars = plt.bar(methods, errors, color=['red', 'blue', 'green'])
-    plt.yscale('log')
-    plt.ylabel('Absolute Error')
-    plt.title(f'Error Comparison (n={n})')
-    plt.xticks(rotation=30)
+    bars = ax.bar(methods, errors, color=['red', 'blue', 'green'])
+    ax.set_yscale('log')
+    ax.set_ylabel('Absolute Error')
+    ax.set_title(f'Error Comparison (n={n_intervals})')
+    ax.tick_params(axis='x', labelrotation=30)
     
     for bar, error in zip(bars, errors):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
                 f'{error:.1e}', ha='center', va='bottom', fontsize=8)
-    plt.show()
+
+def _plot_table(ax, results):
     # Plot 3: Results table
-    #plt.subplot(1, 3, 3)
-    plt.axis('off')
+    riemann_result, trapezoidal_result, simpson_result = results
+    ax.axis('off')
     
     table_data = [
         ['Method', 'Result', 'Error'],
@@ -109,25 +511,78 @@ def create_plots(riemann_result, trapezoidal_result, simpson_result):
         ['Analytical', f'{analytical_result:.6f}', '0.00e+00']
     ]
     
-    table = plt.table(cellText=table_data[1:], colLabels=table_data[0],
+    table = ax.table(cellText=table_data[1:], colLabels=table_data[0],
                      cellLoc='center', loc='center')
     table.auto_set_font_size(False)
     table.set_fontsize(9)
     table.scale(1, 1.5)
-    
-    #plt.suptitle(f'Numerical Integration: sin²(x) from 0 to π (Analytical = π/2 = {analytical_result:.6f})', 
-    #            fontsize=14, y=0.98)
-    #plt.subplots_adjust(top=0.85, bottom=0.1, left=0.08, right=0.95, wspace=0.3)
-    plt.show()
 
-def print_results(riemann_result, trapezoidal_result, simpson_result, numpy_trapz, scipy_quad,
-                 riemann_error, trapezoidal_error, simpson_error, numpy_error, quad_error):
+def create_plots(riemann_result, trapezoidal_result, simpson_result, save_path=None, n_intervals=None):
+    """
+    Create visualization plots.
+
+    Without save_path the three plots are shown one after another. With
+    save_path they are drawn side by side into one headless figure (no
+    pyplot or display needed) and written to that file; the figure and the
+    function plot are reused on later calls, only the error bars and the
+    table are redrawn.
+    """
+    results = [riemann_result, trapezoidal_result, simpson_result]
+    n_intervals = n if n_intervals is None else n_intervals
+
+    if save_path is None:
+        import matplotlib.pyplot as plt
+
+        _plot_function(plt.figure(figsize=(15, 6)).gca())
+        plt.show()
+        _plot_errors(plt.figure().gca(), results, n_intervals)
+        plt.show()
+        _plot_table(plt.figure().gca(), results)
+        plt.show()
+        return
+
+    import render
+
+    fig, state = render.figure('integration', True, figsize=(15, 6))
+    if not state:
+        _plot_function(fig.add_subplot(1, 3, 1))
+        state['errors'] = fig.add_subplot(1, 3, 2)
+        state['table'] = fig.add_subplot(1, 3, 3)
+    ax_errors, ax_table = state['errors'], state['table']
+    ax_errors.clear()
+    ax_table.clear()
+    _plot_errors(ax_errors, results, n_intervals)
+    _plot_table(ax_table, results)
+    fig.suptitle(f'Numerical Integration: sin²(x) from 0 to π (Analytical = π/2 = {analytical_result:.6f})', 
+                 fontsize=14, y=0.98)
+    fig.subplots_adjust(top=0.85, bottom=0.1, left=0.08, right=0.95, wspace=0.3)
+    fig.savefig(save_path)
+
+def render_intervals(n_intervals, image_path):
+    """Integrate with n_intervals and plot the comparison to image_path"""
+    results = [rule(sin_squared, a, b, n_intervals)
+               for rule in (riemann_sum, trapezoidal_rule, simpsons_rule)]
+    create_plots(*results, save_path=image_path, n_intervals=n_intervals)
+    return image_path
+
+def render_sweep(n_values, output_dir, fmt='png', workers=None):
+    """Plots for every n in n_values written to output_dir/integration_n<n>.<fmt> in parallel"""
+    import render
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(n_value, os.path.join(output_dir, f'integration_n{n_value}.{fmt}')) for n_value in n_values]
+    return render.render_sweep(render_intervals, jobs, workers)
+
+def print_results(riemann_result, trapezoidal_result, simpson_result, gauss_result, numpy_trapz, scipy_quad,
+                 riemann_error, trapezoidal_error, simpson_error, gauss_error, numpy_error, quad_error,
+                 evaluations=None):
     """Print numerical results summary"""
     
     print(f"Final integration results:")
     print(f"  Riemann sum: {riemann_result:.6f}")
     print(f"  Trapezoidal rule: {trapezoidal_result:.6f}")
     print(f"  Simpson's rule: {simpson_result:.6f}")
+    print(f"  Gauss-Legendre ({gauss_order} nodes): {gauss_result:.6f}")
     print(f"  NumPy trapz: {numpy_trapz:.6f}")
     print(f"  SciPy quad: {scipy_quad:.6f}")
     print(f"  Analytical: {analytical_result:.10f}")
@@ -136,6 +591,7 @@ def print_results(riemann_result, trapezoidal_result, simpson_result, numpy_trap
     print(f"  Riemann - Error: {riemann_error:.2e}")
     print(f"  Trapezoidal - Error: {trapezoidal_error:.2e}")
     print(f"  Simpson's - Error: {simpson_error:.2e}")
+    print(f"  Gauss-Legendre - Error: {gauss_error:.2e}")
     print(f"  NumPy trapz - Error: {numpy_error:.2e}")
     print(f"  SciPy quad - Error: {quad_error:.2e}")
 
@@ -143,8 +599,15 @@ def print_results(riemann_result, trapezoidal_result, simpson_result, numpy_trap
         ("Riemann", riemann_error),
         ("Trapezoidal", trapezoidal_error),
         ("Simpson's", simpson_error),
+        ("Gauss-Legendre", gauss_error),
         ("NumPy trapz", numpy_error),
         ("SciPy quad", quad_error)
     ], key=lambda x: x[1])
 
-    print(f"\nMost accurate method: {best_method[0]} with error {best_method[1]:.2e}")
\ No newline at end of file
+    print(f"\nMost accurate method: {best_method[0]} with error {best_method[1]:.2e}")
+
+    if evaluations:
+        print(f"\nIntegrand evaluations:")
+        for name, counts in evaluations.items():
+            print(f"  {name}: {counts['points']} points in {counts['calls']} calls, "
+                  f"{counts['time'] * 1e6:.1f} us in integrand")
\ No newline at end of file
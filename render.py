@@ -0,0 +1,54 @@
+# Headless figure rendering shared by the plotting functions
+from itertools import repeat
+
+import numpy as np
+
+# Figures reused across calls when rendering to files, one per name and
+# process, each with a dict the caller keeps its artists in
+_figures = {}
+
+def figure(name, headless, **kwargs):
+    """
+    Figure for a plot and a state dict for the caller's artists. Headless
+    figures are plain matplotlib Figure objects (Agg canvas, no pyplot, no
+    GUI backend), created once per name and returned again with the same
+    dict on later calls, so the caller can update the artists it stored
+    there instead of rebuilding them. The dict is empty for a new figure.
+    Returns (fig, state).
+    """
+    if not headless:
+        import matplotlib.pyplot as plt
+        return plt.figure(**kwargs), {}
+    if name not in _figures:
+        from matplotlib.figure import Figure
+        _figures[name] = Figure(**kwargs), {}
+    return _figures[name]
+
+def downsample(x, *ys, max_points=None):
+    """
+    Every k-th sample of x and the series ys (plus the last one) so at most
+    about max_points are plotted. Works on memory-mapped arrays without
+    reading the skipped samples.
+    """
+    if max_points is None or len(x) <= max_points:
+        return (x,) + ys
+    stride = -(-len(x) // max_points)
+    index = np.append(np.arange(0, len(x) - 1, stride), len(x) - 1)
+    return tuple(np.asarray(series)[index] for series in (x,) + ys)
+
+def _render(func, job):
+    return func(*job)
+
+def render_sweep(func, jobs, workers=None, chunksize=4):
+    """
+    Call func(*job) for every job in worker processes and return the
+    results in order. func must be a module-level function; each worker
+    keeps its figures between jobs, so the layout is built once per worker.
+    """
+    jobs = list(jobs)
+    if workers == 1:
+        return [func(*job) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render, repeat(func), jobs, chunksize=chunksize))
@@ -2,55 +2,282 @@
 # Runge Kutta
 import numpy as np
 
-def calc_next_step(y, t, step=0.1, mass=10, k=1):
-    k1 = compute_derivaties(y, t, mass, k)
-    k2 = compute_k2(y, t, step, k1, mass, k)
-    return update_y(y, k1, k2, step)
-
-def compute_derivaties(y, t, mass, k):
-    derivative = [y[1]] # velocity, dy_0/dt
-    derivative.append(-k*y[0]/mass) # acceleration, dy_1/dt
-    return derivative
-
-def compute_k2(y, t, step, k_1, mass, k):
-    yaux = [y[0]+step * k_1[0]/2]
-    yaux.append(y[1]+step * k_1[1]/2)
-    return compute_derivaties(yaux, t+step/2, mass, k)
-
-def update_y(y, k_1, k_2, step):
-    y[0] = y[0] + step*(k_1[0] + 2*k_2[0])/6 # new position
-    y[1] = y[1] + step*(k_1[1] + 2*k_2[1])/6 # new velocity
-    return y
-    
-def RungeKutta(pos_0, vel_0, step_size=0.1, max_time=10, mass=10, k=1):
-
-    # User input
-    x_0 = pos_0
-    y = [x_0, vel_0]
+from simresult import SimulationResult
+
+RK_COLUMNS = ['time', 'position', 'velocity', 'PE', 'KE', 'total_energy']
+
+# Explicit Butcher tableaus (c, A, b)
+TABLEAUS = {
+    'euler': ([0.0],
+              [[0.0]],
+              [1.0]),
+    'midpoint': ([0.0, 0.5],
+                 [[0.0, 0.0],
+                  [0.5, 0.0]],
+                 [0.0, 1.0]),
+    'heun': ([0.0, 1.0],
+             [[0.0, 0.0],
+              [1.0, 0.0]],
+             [0.5, 0.5]),
+    'rk4': ([0.0, 0.5, 0.5, 1.0],
+            [[0.0, 0.0, 0.0, 0.0],
+             [0.5, 0.0, 0.0, 0.0],
+             [0.0, 0.5, 0.0, 0.0],
+             [0.0, 0.0, 1.0, 0.0]],
+            [1/6, 1/3, 1/3, 1/6]),
+    'rk38': ([0.0, 1/3, 2/3, 1.0],
+             [[0.0, 0.0, 0.0, 0.0],
+              [1/3, 0.0, 0.0, 0.0],
+              [-1/3, 1.0, 0.0, 0.0],
+              [1.0, -1.0, 1.0, 0.0]],
+             [1/8, 3/8, 3/8, 1/8]),
+}
+
+def integrate(rhs, y0, step, num_steps, method='rk4', t0=0.0, out=None):
+    """
+    Explicit Runge-Kutta integration driven by a Butcher tableau.
+
+    rhs(t, y, dydt) must write the derivative of y into dydt. method is a
+    key of TABLEAUS or a (c, A, b) tuple. y0 may have any shape (e.g. one
+    column per oscillator); the stage buffers are allocated once and each
+    step writes straight into the preallocated trajectory `out` of shape
+    (num_steps + 1,) + y0.shape, so no arrays are created per step.
+
+    Returns the trajectory array.
+    """
+    c, A, b = TABLEAUS[method] if isinstance(method, str) else method
+    c = np.asarray(c, dtype=float)
+    hA = step * np.asarray(A, dtype=float)
+    hb = step * np.asarray(b, dtype=float)
+    num_stages = len(hb)
+
+    y = np.array(y0, dtype=float)
+    if out is None:
+        out = np.empty((num_steps + 1,) + y.shape)
+    out[0] = y
+
+    stages = np.empty((num_stages,) + y.shape)
+    work = np.empty_like(y)
+    stages_flat = stages.reshape(num_stages, -1)
+    work_flat = work.reshape(-1)
+
+    for i in range(num_steps):
+        t = t0 + i * step
+        for s in range(num_stages):
+            if s == 0:
+                work[...] = y
+            else:
+                np.dot(hA[s, :s], stages_flat[:s], out=work_flat)
+                work += y
+            rhs(t + c[s] * step, work, stages[s])
+        np.dot(hb, stages_flat, out=work_flat)
+        y += work
+        out[i + 1] = y
+    return out
+
+def compute_derivaties(y, t, mass, k, dydt):
+    dydt[0] = y[1] # velocity, dy_0/dt
+    np.multiply(y[:1], -k / mass, out=dydt[1:]) # acceleration, dy_1/dt
+    return dydt
+
+def energies(states, mass, k, out=None):
+    """
+    Potential and kinetic energy of (position, velocity) states along axis
+    1 of `states` (so (steps, 2) or (steps, 2, N)), in one vectorized pass.
+    """
+    coeffs = 0.5 * np.array([k, mass], dtype=float).reshape((2,) + (1,) * (np.ndim(states) - 2))
+    if out is None:
+        out = np.empty(np.shape(states))
+    np.square(states, out=out)
+    out *= coeffs
+    return out
+
+def oscillator_result(steps, count=None, metadata=None):
+    """
+    Empty SimulationResult for one oscillator (columns RK_COLUMNS) or, with
+    count = N, for N oscillators with one column per oscillator grouped by
+    quantity ('position.0' ... 'position.N-1', 'velocity.0', ...), so that
+    result.state('position') is a (steps, N) view.
+
+    Returns (result, states, energy, total) where states and energy are
+    (steps, 2) or (steps, 2, N) views of (position, velocity) and (PE, KE)
+    and total is the total_energy view, for the solver to write into.
+    """
+    if count is None:
+        result = SimulationResult.empty(steps, RK_COLUMNS, metadata)
+        data = result.data
+        return result, data[:, 1:3], data[:, 3:5], data[:, 5]
+    columns = ['time'] + [f'{name}.{i}' for name in RK_COLUMNS[1:] for i in range(count)]
+    result = SimulationResult.empty(steps, columns, metadata)
+    data = result.data
+    # Splitting the last axis of a column slice is always a view
+    states = data[:, 1:1 + 2 * count].reshape(steps, 2, count)
+    energy = data[:, 1 + 2 * count:1 + 4 * count].reshape(steps, 2, count)
+    return result, states, energy, data[:, 1 + 4 * count:]
+
+class Decimate:
+    """Output policy keeping every `every`-th sample (counting from t = 0)"""
+
+    def __init__(self, every):
+        self.every = every
+        self._seen = 0
+        self._blocks = []
+
+    def write(self, time, states, energy):
+        first = -self._seen % self.every
+        self._seen += len(time)
+        keep = slice(first, None, self.every)
+        self._blocks.append((time[keep].copy(), states[keep].copy(), energy[keep].copy()))
+
+    def result(self):
+        """The kept samples as a SimulationResult laid out like RungeKutta's"""
+        count = self._blocks[0][1].shape[2] if self._blocks[0][1].ndim == 3 else None
+        steps = sum(len(block[0]) for block in self._blocks)
+        result, states, energy, total = oscillator_result(steps, count, {'every': self.every})
+        start = 0
+        for block_time, block_states, block_energy in self._blocks:
+            stop = start + len(block_time)
+            result.time[start:stop] = block_time
+            states[start:stop] = block_states
+            energy[start:stop] = block_energy
+            start = stop
+        np.add(energy[:, 0], energy[:, 1], out=total)
+        return result
+
+class RunningStats:
+    """
+    Output policy keeping only running statistics of the total energy:
+    min, max, mean and the largest relative drift |E - E0| / |E0|, plus
+    the final time and state. Memory does not grow with the run length.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.initial = self.min = self.max = self.total = self.drift = None
+        self.time = self.state = None
+
+    def write(self, time, states, energy):
+        total_energy = energy.sum(axis=1)
+        if self.count == 0:
+            self.initial = total_energy[0].copy()
+            self.min = total_energy.min(axis=0)
+            self.max = total_energy.max(axis=0)
+            self.total = total_energy.sum(axis=0)
+            self.drift = np.zeros_like(self.initial)
+        else:
+            self.min = np.minimum(self.min, total_energy.min(axis=0))
+            self.max = np.maximum(self.max, total_energy.max(axis=0))
+            self.total = self.total + total_energy.sum(axis=0)
+        drift = np.abs(total_energy - self.initial).max(axis=0) / np.abs(self.initial)
+        self.drift = np.maximum(self.drift, drift)
+        self.count += len(time)
+        self.time = time[-1]
+        self.state = states[-1].copy()
+
+    def result(self):
+        return {'samples': self.count, 'initial': self.initial, 'min': self.min, 'max': self.max,
+                'mean': self.total / self.count, 'max_drift': self.drift,
+                'final_time': self.time, 'final_state': self.state}
+
+class Stream:
+    """
+    Output policy handing each block to `target` as it is produced. target
+    is either a callable f(time, states, energy) or a file path; a file
+    gets raw float64 rows of time, position(s), velocity(ies), PE(s),
+    KE(s) (readable with np.fromfile(...).reshape(-1, 1 + 4 * N)).
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.rows = 0
+        self._file = None if callable(target) else open(target, 'wb')
+
+    def write(self, time, states, energy):
+        if self._file is None:
+            self.target(time, states, energy)
+        else:
+            rows = len(time)
+            block = np.concatenate([time.reshape(rows, 1), states.reshape(rows, -1),
+                                    energy.reshape(rows, -1)], axis=1)
+            block.tofile(self._file)
+        self.rows += len(time)
+
+    def result(self):
+        if self._file is not None:
+            self._file.close()
+        return self.rows
+
+def run_blocks(advance, state0, step_size, num_steps, mass, k, output, block_size=4096):
+    """
+    Drive a stepper block by block and feed every sample to an output
+    policy (Decimate, RunningStats, Stream or anything with write/result).
+
+    advance(t0, y, count, out) must fill out[0] = y and out[1:count + 1]
+    with the next count states. Only one block buffer is allocated, so
+    memory is O(block_size) whatever num_steps is. Returns output.result().
+    """
+    y = np.array(state0, dtype=float)
+    buffer = np.empty((block_size + 1,) + y.shape)
+    energy = np.empty_like(buffer)
+    offsets = np.arange(block_size + 1)
+    done = 0
+    first = 0  # the initial state is only emitted with the first block
+    while True:
+        count = min(block_size, num_steps - done)
+        advance(done * step_size, y, count, buffer[:count + 1])
+        energies(buffer[first:count + 1], mass, k, out=energy[first:count + 1])
+        output.write((done + offsets[first:count + 1]) * step_size,
+                     buffer[first:count + 1], energy[first:count + 1])
+        done += count
+        y[...] = buffer[count]
+        first = 1
+        if done >= num_steps:
+            return output.result()
+
+def RungeKutta(pos_0, vel_0, step_size=0.1, max_time=10, mass=10, k=1, method='midpoint', output=None):
+    """
+    Returns a SimulationResult with columns time, position, velocity, PE,
+    KE and total_energy (one row per time including t = 0); it unpacks
+    like the old (time, pos, vel, PE, KE, total_energy) tuple.
+
+    pos_0 and vel_0 may also be arrays (broadcast against each other) to
+    advance N oscillators together in a (2, N) state. The result then has
+    one column per oscillator and quantity (see oscillator_result); use
+    result.state('position') etc. for the (steps, N) arrays.
+
+    With an output policy (Decimate, RunningStats or Stream) nothing is
+    stored for the whole run; the trajectory is produced in blocks and the
+    policy's result is returned instead.
+    """
 
     # Making time array
-    time_arr = np.arange(0, max_time/step_size)
-    time_arr = time_arr * step_size
+    num_steps = int(np.ceil(max_time/step_size))
+    time = np.arange(num_steps + 1) * step_size
+    rhs = lambda t, y, dydt: compute_derivaties(y, t, mass, k, dydt)
+
+    if output is not None:
+        state0 = np.stack(np.broadcast_arrays(np.asarray(pos_0, dtype=float), np.asarray(vel_0, dtype=float)))
+        if state0.ndim > 1:
+            state0 = state0.reshape(2, -1)
+        advance = lambda t0, y, count, out: integrate(rhs, y, step_size, count, method, t0, out)
+        return run_blocks(advance, state0, step_size, num_steps, mass, k, output)
+
+    count = None
+    state0 = [pos_0, vel_0]
+    if np.ndim(pos_0) or np.ndim(vel_0):
+        pos_0, vel_0 = np.broadcast_arrays(np.asarray(pos_0, dtype=float), np.asarray(vel_0, dtype=float))
+        state0 = np.stack([pos_0.ravel(), vel_0.ravel()])
+        count = state0.shape[1]
+        pos_0, vel_0 = pos_0.ravel().tolist(), vel_0.ravel().tolist()
+
+    metadata = {'pos_0': pos_0, 'vel_0': vel_0, 'step_size': step_size, 'max_time': max_time,
+                'mass': mass, 'k': k, 'method': method}
+    result, states, energy, total = oscillator_result(num_steps + 1, count, metadata)
+    result.time[:] = time
 
     # Applying Runge Kutta approximation
-    pos_arr = [y[0]]
-    vel_arr = [y[1]]
-    PE_arr = [-k * x_0**2]
-    KE_arr = [0.5 * mass * vel_0**2]
-    #total_energy = [KE_arr[0] + PE_arr[0]]
-    total_energy = []
-    for time in time_arr:
-        y = calc_next_step(y, time)
-        pos_arr.append(y[0])
-        vel_arr.append(y[1])
-        pos = pos_arr[-1]
-        vel = vel_arr[-1]
-        PE = -k * pos**2
-        PE_arr.append(PE)
-        KE = 0.5 * mass * vel**2
-        KE_arr.append(KE)
-        total_energy.append(PE + KE)
-
-    return time_arr, pos_arr, vel_arr, PE_arr, KE_arr, total_energy
-    
-    
+    integrate(rhs, state0, step_size, num_steps, method, out=states)
+    energies(states, mass, k, out=energy)
+    np.add(energy[:, 0], energy[:, 1], out=total)
+
+    return result
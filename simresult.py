@@ -0,0 +1,104 @@
+import json
+
+import numpy as np
+
+class SimulationResult:
+    """
+    Simulation output stored in one contiguous 2D array.
+
+    Each column is a named series; names of the form 'method.quantity'
+    (e.g. 'rk4.displacement') group the state of one method. Indexing by
+    name and state() return views into `data`, never copies. Iterating
+    yields the columns in order, so a result can still be unpacked like
+    the tuples the solvers used to return.
+    """
+
+    __slots__ = ('data', 'columns', 'metadata', '_index')
+
+    def __init__(self, data, columns, metadata=None):
+        data = np.asarray(data)
+        if data.ndim != 2 or data.shape[1] != len(columns):
+            raise ValueError(f"data of shape {data.shape} does not match {len(columns)} columns")
+        self.data = data
+        self.columns = tuple(columns)
+        self.metadata = dict(metadata or {})
+        self._index = {name: i for i, name in enumerate(self.columns)}
+
+    @classmethod
+    def empty(cls, steps, columns, metadata=None):
+        """Allocate an uninitialized result for the solver to write into"""
+        return cls(np.empty((steps, len(columns))), columns, metadata)
+
+    def __getitem__(self, name):
+        return self.data[:, self._index[name]]
+
+    def __iter__(self):
+        for i in range(len(self.columns)):
+            yield self.data[:, i]
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __repr__(self):
+        columns = list(self.columns)
+        if len(columns) > 8:
+            columns = columns[:4] + ['...'] + columns[-3:]
+        return f"SimulationResult(steps={self.data.shape[0]}, columns={columns})"
+
+    @property
+    def time(self):
+        return self['time']
+
+    @property
+    def methods(self):
+        """Method names, in column order"""
+        names = []
+        for column in self.columns:
+            if '.' in column and column.split('.')[0] not in names:
+                names.append(column.split('.')[0])
+        return names
+
+    def state(self, method):
+        """
+        (steps, quantities) view of all columns of one method. The columns
+        must be adjacent, since solvers write through this view; a group
+        split by other columns raises ValueError instead of copying.
+        """
+        positions = [i for i, column in enumerate(self.columns) if column.startswith(method + '.')]
+        if not positions:
+            raise KeyError(method)
+        if positions != list(range(positions[0], positions[-1] + 1)):
+            raise ValueError(f"columns of {method!r} are not adjacent, so they have no view")
+        return self.data[:, positions[0]:positions[-1] + 1]
+
+    def save(self, path):
+        """
+        Write to path. '.npz' stores everything in one archive; any other
+        path is written as a .npy array (which load() can memory-map) with
+        the column names and metadata in a '.json' file next to it.
+        """
+        header = {'columns': list(self.columns), 'metadata': self.metadata}
+        if path.endswith('.npz'):
+            np.savez(path, data=self.data, header=json.dumps(header))
+        else:
+            np.save(path, np.ascontiguousarray(self.data))
+            with open(_header_path(path), 'w') as f:
+                json.dump(header, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """Read a saved result; .npy results are memory-mapped unless mmap_mode is None"""
+        if path.endswith('.npz'):
+            with np.load(path) as archive:
+                data = archive['data']
+                header = json.loads(str(archive['header']))
+        else:
+            data = np.load(path if path.endswith('.npy') else path + '.npy', mmap_mode=mmap_mode)
+            with open(_header_path(path)) as f:
+                header = json.load(f)
+        return cls(data, header['columns'], header['metadata'])
+
+def _header_path(path):
+    if not path.endswith('.npy'):
+        path = path + '.npy'
+    return path[:-4] + '.json'
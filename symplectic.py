@@ -0,0 +1,139 @@
+# Symplectic integrators for the simple harmonic oscillator
+# and a long-horizon energy-drift benchmark
+import argparse
+import time
+
+import numpy as np
+
+import rungekutta as rk
+
+# 4th order Yoshida coefficients
+_W1 = 1 / (2 - 2**(1/3))
+_W0 = -2**(1/3) * _W1
+YOSHIDA_C = (_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2)
+YOSHIDA_D = (_W1, _W0, _W1)
+
+RK_BLOCK = 4096
+
+def symplectic_euler(x, v, accel, step, num_steps):
+    """Semi-implicit Euler as in SHM.py: kick with a(x), then drift with the new v"""
+    for _ in range(num_steps):
+        v = v + accel(x) * step
+        x = x + v * step
+    return x, v
+
+def velocity_verlet(x, v, accel, step, num_steps):
+    """Velocity Verlet (kick-drift-kick leapfrog), 2nd order, one force evaluation per step"""
+    a = accel(x)
+    half = step / 2
+    for _ in range(num_steps):
+        v = v + a * half
+        x = x + v * step
+        a = accel(x)
+        v = v + a * half
+    return x, v
+
+def leapfrog(x, v, accel, step, num_steps):
+    """Position Verlet (drift-kick-drift leapfrog), 2nd order"""
+    half = step / 2
+    for _ in range(num_steps):
+        x = x + v * half
+        v = v + accel(x) * step
+        x = x + v * half
+    return x, v
+
+def yoshida4(x, v, accel, step, num_steps):
+    """4th order Yoshida composition of leapfrog, three force evaluations per step"""
+    c1, c2, c3, c4 = [c * step for c in YOSHIDA_C]
+    d1, d2, d3 = [d * step for d in YOSHIDA_D]
+    for _ in range(num_steps):
+        x = x + v * c1
+        v = v + accel(x) * d1
+        x = x + v * c2
+        v = v + accel(x) * d2
+        x = x + v * c3
+        v = v + accel(x) * d3
+        x = x + v * c4
+    return x, v
+
+def runge_kutta4(x, v, accel, step, num_steps):
+    """Classical RK4 through the shared tableau engine, for comparison"""
+    def rhs(t, y, dydt):
+        dydt[0] = y[1]
+        dydt[1] = accel(y[0])
+    y = np.array([x, v], dtype=float)
+    # Reuse one small trajectory buffer instead of storing the whole run
+    out = np.empty((RK_BLOCK + 1, 2))
+    done = 0
+    while done < num_steps:
+        count = min(RK_BLOCK, num_steps - done)
+        rk.integrate(rhs, y, step, count, 'rk4', out=out[:count + 1])
+        y = out[count].copy()
+        done += count
+    return y[0], y[1]
+
+INTEGRATORS = {
+    'euler': symplectic_euler,
+    'verlet': velocity_verlet,
+    'leapfrog': leapfrog,
+    'yoshida4': yoshida4,
+    'rk4': runge_kutta4,
+}
+
+def energy_drift(method, x0=5.0, v0=0.0, m=1.0, k=10.0, step=0.01, num_steps=10**6, samples=100):
+    """
+    Integrate the oscillator for num_steps and sample the relative energy
+    error |E - E0| / E0 at `samples` evenly spaced times.
+
+    Returns (times, drift, wall_time) where wall_time excludes the sampling.
+    """
+    omega2 = k / m
+    accel = lambda x: -omega2 * x
+    integrator = INTEGRATORS[method]
+    energy0 = 0.5 * m * v0**2 + 0.5 * k * x0**2
+
+    block = max(1, num_steps // samples)
+    times = []
+    drift = []
+    x, v = x0, v0
+    wall_time = 0.0
+    done = 0
+    while done < num_steps:
+        count = min(block, num_steps - done)
+        start = time.perf_counter()
+        x, v = integrator(x, v, accel, step, count)
+        wall_time += time.perf_counter() - start
+        done += count
+        times.append(done * step)
+        drift.append(abs(0.5 * m * v**2 + 0.5 * k * x**2 - energy0) / energy0)
+    return np.array(times), np.array(drift), wall_time
+
+def benchmark(num_steps=10**6, step=0.01, methods=None):
+    """Energy drift against cost for every integrator; returns a list of records"""
+    records = []
+    for method in methods or INTEGRATORS:
+        _, drift, wall_time = energy_drift(method, step=step, num_steps=num_steps)
+        records.append({
+            'method': method,
+            'steps': num_steps,
+            'max_drift': drift.max(),
+            'final_drift': drift[-1],
+            'wall_time_s': wall_time,
+            'steps_per_s': num_steps / wall_time,
+        })
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description='Long-horizon energy drift of SHM integrators')
+    parser.add_argument('--steps', type=float, default=1e6)
+    parser.add_argument('--dt', type=float, default=0.01)
+    parser.add_argument('--methods', nargs='+', choices=list(INTEGRATORS))
+    args = parser.parse_args()
+
+    print(f"{'Method':<10}{'Max drift':>12}{'Final drift':>14}{'Time (s)':>10}{'Steps/s':>12}")
+    for r in benchmark(int(args.steps), args.dt, args.methods):
+        print(f"{r['method']:<10}{r['max_drift']:>12.2e}{r['final_drift']:>14.2e}"
+              f"{r['wall_time_s']:>10.2f}{r['steps_per_s']:>12.3g}")
+
+if __name__ == "__main__":
+    main()